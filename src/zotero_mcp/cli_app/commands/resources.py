@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 from collections.abc import Awaitable, Callable
 import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from zotero_mcp.cli_app.common import (
     add_output_arg,
     add_scan_limit_arg,
     add_treated_limit_arg,
+    run_coro,
 )
-from zotero_mcp.cli_app.output import emit
+from zotero_mcp.cli_app.output import emit, emit_stream
 from zotero_mcp.utils.config import load_config
 from zotero_mcp.utils.formatting.helpers import normalize_item_key
 
@@ -131,7 +136,7 @@ def register_items(subparsers: argparse._SubParsersAction) -> None:
         default=False,
         help="Preview empty items without deleting (default: disabled)",
     )
-    add_output_arg(delete_empty)
+    add_output_arg(delete_empty, streaming=True)
 
 
 def run_items(args: argparse.Namespace) -> int:
@@ -143,6 +148,8 @@ def run_items(args: argparse.Namespace) -> int:
     maintenance_service = LibraryMaintenanceService()
 
     def _load_json(path: str) -> Any:
+        if orjson is not None:
+            return orjson.loads(Path(path).read_bytes())
         with open(path, encoding="utf-8") as file:
             return json.load(file)
 
@@ -186,6 +193,7 @@ def run_items(args: argparse.Namespace) -> int:
             scan_limit=args.scan_limit,
             treated_limit=args.treated_limit,
             dry_run=args.dry_run,
+            on_record=emit_stream(args),
         ),
     }
 
@@ -193,7 +201,7 @@ def run_items(args: argparse.Namespace) -> int:
     if handler is None:
         raise ValueError(f"Unknown items subcommand: {args.subcommand}")
 
-    return _emit_result(args, asyncio.run(_await_handler(handler)))
+    return _emit_result(args, run_coro(_await_handler(handler)))
 
 
 def register_notes(subparsers: argparse._SubParsersAction) -> None:
@@ -303,7 +311,7 @@ def run_notes(args: argparse.Namespace) -> int:
     if handler is None:
         raise ValueError(f"Unknown notes subcommand: {args.subcommand}")
 
-    return _emit_result(args, asyncio.run(_await_handler(handler)))
+    return _emit_result(args, run_coro(_await_handler(handler)))
 
 
 def register_annotations(subparsers: argparse._SubParsersAction) -> None:
@@ -379,7 +387,7 @@ def run_annotations(args: argparse.Namespace) -> int:
     if handler is None:
         raise ValueError(f"Unknown annotations subcommand: {args.subcommand}")
 
-    return _emit_result(args, asyncio.run(_await_handler(handler)))
+    return _emit_result(args, run_coro(_await_handler(handler)))
 
 
 def register_pdfs(subparsers: argparse._SubParsersAction) -> None:
@@ -435,7 +443,7 @@ def run_pdfs(args: argparse.Namespace) -> int:
     if handler is None:
         raise ValueError(f"Unknown pdfs subcommand: {args.subcommand}")
 
-    return _emit_result(args, asyncio.run(_await_handler(handler)))
+    return _emit_result(args, run_coro(_await_handler(handler)))
 
 
 def register_collections(subparsers: argparse._SubParsersAction) -> None:
@@ -527,7 +535,7 @@ def run_collections(args: argparse.Namespace) -> int:
     if handler is None:
         raise ValueError(f"Unknown collections subcommand: {args.subcommand}")
 
-    return _emit_result(args, asyncio.run(_await_handler(handler)))
+    return _emit_result(args, run_coro(_await_handler(handler)))
 
 
 __all__ = [
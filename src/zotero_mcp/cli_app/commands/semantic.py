@@ -3,19 +3,28 @@
 from __future__ import annotations
 
 import argparse
-import json
+from collections.abc import Iterator
 import os
 from pathlib import Path
-from typing import Literal
+import re
+import stat
+import tempfile
+from typing import Any, Literal
 
 from zotero_mcp.cli_app.common import (
+    LazyArgumentParser,
     add_all_arg,
+    add_lazy_parser,
     add_output_arg,
     add_scan_limit_arg,
     add_treated_limit_arg,
 )
-from zotero_mcp.cli_app.output import emit
-from zotero_mcp.utils.config import load_config
+from zotero_mcp.cli_app.output import dumps_json, emit
+from zotero_mcp.utils.config import (
+    clear_json_file_cache,
+    load_config,
+    load_json_file,
+)
 
 IncludeField = Literal[
     "documents",
@@ -26,6 +35,12 @@ IncludeField = Literal[
     "data",
 ]
 
+# Rows fetched per Chroma page when scanning db-inspect filters.
+_INSPECT_PAGE_SIZE = 100
+
+# db-inspect --filter-field choices mapped to Chroma metadata keys.
+_FILTER_FIELD_MAP = {"doi": "doi", "title": "title", "author": "creators"}
+
 
 def _save_zotero_db_path_to_config(config_path: Path, db_path: str) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -33,8 +48,7 @@ def _save_zotero_db_path_to_config(config_path: Path, db_path: str) -> None:
     full_config: dict = {}
     if config_path.exists():
         try:
-            with open(config_path, encoding="utf-8") as f:
-                full_config = json.load(f)
+            full_config = load_json_file(config_path)
         except Exception as exc:
             raise ValueError(
                 f"Failed to parse config at {config_path}: {exc}"
@@ -43,8 +57,54 @@ def _save_zotero_db_path_to_config(config_path: Path, db_path: str) -> None:
     full_config.setdefault("semantic_search", {})
     full_config["semantic_search"]["zotero_db_path"] = db_path
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(full_config, f, indent=2)
+    # Write to a sibling temp file and swap it in so an interrupted write
+    # never leaves a truncated config behind.
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=config_path.parent,
+            prefix=f".{config_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_path = Path(f.name)
+            f.write(dumps_json(full_config))
+            f.flush()
+            os.fsync(f.fileno())
+        if config_path.exists():
+            # NamedTemporaryFile creates 0600 files; keep the config's mode.
+            os.chmod(tmp_path, stat.S_IMODE(config_path.stat().st_mode))
+        os.replace(tmp_path, config_path)
+        clear_json_file_cache()
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _scan_collection(
+    col: Any, include: list[IncludeField], page_size: int = _INSPECT_PAGE_SIZE
+) -> Iterator[tuple[str, dict, str | None]]:
+    """Yield ``(id, metadata, document)`` rows from a Chroma collection by page.
+
+    Pages are fetched lazily, so callers that stop early never pull the rest
+    of the collection across the client boundary.
+    """
+    offset = 0
+    while True:
+        page = col.get(limit=page_size, offset=offset, include=include)
+        ids = page.get("ids") or []
+        metadatas = page.get("metadatas") or []
+        documents = page.get("documents") or []
+        for i, meta in enumerate(metadatas):
+            doc_id = ids[i] if i < len(ids) else ""
+            document = documents[i] if i < len(documents) else None
+            yield doc_id, meta, document
+        if len(metadatas) < page_size:
+            return
+        offset += page_size
 
 
 def _add_local_mode_arg(parser: argparse.ArgumentParser) -> None:
@@ -60,13 +120,7 @@ def _add_local_mode_arg(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def register(subparsers: argparse._SubParsersAction) -> None:
-    semantic = subparsers.add_parser("semantic", help="Semantic database commands")
-    semantic_sub = semantic.add_subparsers(dest="subcommand", required=True)
-
-    db_update = semantic_sub.add_parser(
-        "db-update", help="Update semantic search database"
-    )
+def _build_db_update_parser(db_update: argparse.ArgumentParser) -> None:
     db_update.add_argument(
         "--force-rebuild", action="store_true", help="Force complete rebuild"
     )
@@ -87,19 +141,21 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     _add_local_mode_arg(db_update)
     add_output_arg(db_update)
 
-    db_status = semantic_sub.add_parser("db-status", help="Show database status")
+
+def _build_db_status_parser(db_status: argparse.ArgumentParser) -> None:
     db_status.add_argument("--config-path", help="Path to semantic search config")
     _add_local_mode_arg(db_status)
     add_output_arg(db_status)
 
-    inspect = semantic_sub.add_parser("db-inspect", help="Inspect indexed documents")
+
+def _build_db_inspect_parser(inspect: argparse.ArgumentParser) -> None:
     inspect.add_argument(
         "--limit", type=int, default=20, help="How many records to show"
     )
     inspect.add_argument("--filter", dest="filter_text", help="Filter by title/creator")
     inspect.add_argument(
         "--filter-field",
-        choices=["doi", "title", "author"],
+        choices=list(_FILTER_FIELD_MAP),
         default="title",
         help="Field to filter by (default: title)",
     )
@@ -112,6 +168,32 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     add_output_arg(inspect)
 
 
+def register(subparsers: argparse._SubParsersAction) -> None:
+    semantic = subparsers.add_parser("semantic", help="Semantic database commands")
+    semantic_sub = semantic.add_subparsers(
+        dest="subcommand", required=True, parser_class=LazyArgumentParser
+    )
+
+    add_lazy_parser(
+        semantic_sub,
+        "db-update",
+        _build_db_update_parser,
+        help="Update semantic search database",
+    )
+    add_lazy_parser(
+        semantic_sub,
+        "db-status",
+        _build_db_status_parser,
+        help="Show database status",
+    )
+    add_lazy_parser(
+        semantic_sub,
+        "db-inspect",
+        _build_db_inspect_parser,
+        help="Inspect indexed documents",
+    )
+
+
 def run(args: argparse.Namespace) -> int:
     load_config()
     os.environ["ZOTERO_LOCAL"] = "true" if getattr(args, "local", True) else "false"
@@ -160,30 +242,49 @@ def run(args: argparse.Namespace) -> int:
         records: list[dict] = []
 
         if args.filter_text:
-            field_map = {"doi": "doi", "title": "title", "author": "creators"}
-            target_field = field_map[args.filter_field]
-            needle = args.filter_text.lower()
-            fetch_limit = max(args.limit * 10, 500)
-            total_count = col.count()
-            offset = 0
-            while offset < total_count and len(records) < args.limit:
-                results = col.get(limit=fetch_limit, offset=offset, include=include)
-                metadatas = results.get("metadatas") or []
-                documents = results.get("documents") or []
-                if not metadatas:
+            target_field = _FILTER_FIELD_MAP[args.filter_field]
+            matched_ids: set[str] = set()
+
+            # Exact matches are resolved by Chroma's metadata index; the
+            # case-insensitive substring scan below only fills the remainder.
+            # Chroma raises ValueError for a ``where`` it cannot apply (e.g. a
+            # value type it does not index); then only the scan is used.
+            try:
+                exact = col.get(
+                    where={target_field: args.filter_text},
+                    limit=args.limit,
+                    include=include,
+                )
+            except ValueError:
+                exact = {}
+            exact_metadatas = exact.get("metadatas") or []
+            exact_documents = exact.get("documents") or []
+            for i, doc_id in enumerate(exact.get("ids") or []):
+                if i >= len(exact_metadatas):
                     break
+                meta = exact_metadatas[i]
+                row = {"title": meta.get("title", "Untitled"), "metadata": meta}
+                if args.show_documents and i < len(exact_documents):
+                    row["document_preview"] = exact_documents[i][:100]
+                records.append(row)
+                matched_ids.add(doc_id)
 
-                for i, meta in enumerate(metadatas):
-                    val = meta.get(target_field, "")
-                    if needle not in str(val).lower():
+            search = re.compile(re.escape(args.filter_text), re.IGNORECASE).search
+            if len(records) < args.limit:
+                for doc_id, meta, document in _scan_collection(col, include):
+                    if doc_id in matched_ids:
+                        continue
+                    val = meta.get(target_field)
+                    if val is None or not search(
+                        val if isinstance(val, str) else str(val)
+                    ):
                         continue
                     row = {"title": meta.get("title", "Untitled"), "metadata": meta}
-                    if args.show_documents and i < len(documents):
-                        row["document_preview"] = documents[i][:100]
+                    if args.show_documents and document is not None:
+                        row["document_preview"] = document[:100]
                     records.append(row)
                     if len(records) >= args.limit:
                         break
-                offset += len(metadatas)
         else:
             results = col.get(limit=args.limit, include=include)
             metadatas = results.get("metadatas") or []
@@ -7,12 +7,31 @@ import asyncio
 import shutil
 import sys
 
-from zotero_mcp.cli_app.common import add_output_arg
+from zotero_mcp.cli_app.common import (
+    LazyArgumentParser,
+    add_lazy_parser,
+    add_output_arg,
+)
 from zotero_mcp.cli_app.output import emit
-from zotero_mcp.server import serve
 from zotero_mcp.utils.config import load_config
-from zotero_mcp.utils.system.setup import main as setup_main
-from zotero_mcp.utils.system.updater import update_zotero_mcp
+
+_EXACT_SENSITIVE_KEYS = frozenset(
+    {
+        "ZOTERO_API_KEY",
+        "ZOTERO_LIBRARY_ID",
+        "API_KEY",
+        "LIBRARY_ID",
+        "DEEPSEEK_API_KEY",
+        "OPENAI_API_KEY",
+        "GEMINI_API_KEY",
+    }
+)
+_SENSITIVE_SUFFIXES = ("_API_KEY", "_TOKEN", "_SECRET", "_PASSWORD")
+
+
+def _is_sensitive_key(key: object) -> bool:
+    key_upper = key.upper() if isinstance(key, str) else str(key).upper()
+    return key_upper in _EXACT_SENSITIVE_KEYS or key_upper.endswith(_SENSITIVE_SUFFIXES)
 
 
 def obfuscate_sensitive_value(value: str | None, keep_chars: int = 4) -> str | None:
@@ -27,33 +46,19 @@ def obfuscate_config_for_display(config: dict) -> dict:
     if not isinstance(config, dict):
         return config
 
-    obfuscated = config.copy()
-    exact_sensitive_keys = {
-        "ZOTERO_API_KEY",
-        "ZOTERO_LIBRARY_ID",
-        "API_KEY",
-        "LIBRARY_ID",
-        "DEEPSEEK_API_KEY",
-        "OPENAI_API_KEY",
-        "GEMINI_API_KEY",
+    return {
+        key: (
+            obfuscate_sensitive_value(value)
+            if _is_sensitive_key(key)
+            else obfuscate_config_for_display(value)
+            if isinstance(value, dict)
+            else value
+        )
+        for key, value in config.items()
     }
-    sensitive_suffixes = ("_API_KEY", "_TOKEN", "_SECRET", "_PASSWORD")
-
-    for key, value in obfuscated.items():
-        key_upper = str(key).upper()
-        if key_upper in exact_sensitive_keys or key_upper.endswith(sensitive_suffixes):
-            obfuscated[key] = obfuscate_sensitive_value(value)
-
-    return obfuscated
 
 
-def register(subparsers: argparse._SubParsersAction) -> None:
-    system = subparsers.add_parser("system", help="System and runtime commands")
-    system_sub = system.add_subparsers(dest="subcommand", required=True)
-
-    system_sub.add_parser("serve", help="Run the MCP server over stdio")
-
-    setup = system_sub.add_parser("setup", help="Configure zotero-mcp")
+def _build_setup_parser(setup: argparse.ArgumentParser) -> None:
     setup.add_argument(
         "--no-local",
         action="store_true",
@@ -80,10 +85,8 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         help="Only configure semantic search",
     )
 
-    system_sub.add_parser("setup-info", help="Show installation info")
-    system_sub.add_parser("version", help="Print version information")
 
-    update = system_sub.add_parser("update", help="Update zotero-mcp")
+def _build_update_parser(update: argparse.ArgumentParser) -> None:
     update.add_argument(
         "--check-only", action="store_true", help="Only check for updates"
     )
@@ -96,15 +99,36 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     add_output_arg(update)
 
 
+def register(subparsers: argparse._SubParsersAction) -> None:
+    system = subparsers.add_parser("system", help="System and runtime commands")
+    system_sub = system.add_subparsers(
+        dest="subcommand", required=True, parser_class=LazyArgumentParser
+    )
+
+    system_sub.add_parser("serve", help="Run the MCP server over stdio")
+    add_lazy_parser(
+        system_sub, "setup", _build_setup_parser, help="Configure zotero-mcp"
+    )
+    system_sub.add_parser("setup-info", help="Show installation info")
+    system_sub.add_parser("version", help="Print version information")
+    add_lazy_parser(
+        system_sub, "update", _build_update_parser, help="Update zotero-mcp"
+    )
+
+
 def run(args: argparse.Namespace) -> int:
     sub = args.subcommand
 
     if sub == "serve":
+        from zotero_mcp.server import serve
+
         load_config()
         asyncio.run(serve())
         return 0
 
     if sub == "setup":
+        from zotero_mcp.utils.system.setup import main as setup_main
+
         return int(setup_main(args))
 
     if sub == "version":
@@ -145,6 +169,8 @@ def run(args: argparse.Namespace) -> int:
         return 0
 
     if sub == "update":
+        from zotero_mcp.utils.system.updater import update_zotero_mcp
+
         result = update_zotero_mcp(
             check_only=args.check_only, force=args.force, method=args.method
         )
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from zotero_mcp.cli_app.common import add_output_arg
-from zotero_mcp.cli_app.output import emit
+from zotero_mcp.cli_app.common import add_output_arg, run_coro
+from zotero_mcp.cli_app.output import emit, emit_stream
 from zotero_mcp.utils.config import load_config
 from zotero_mcp.utils.formatting.helpers import normalize_item_key
 from zotero_mcp.utils.formatting.tags import (
@@ -94,7 +93,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=False,
         help="Preview changes without updating (default: disabled)",
     )
-    add_output_arg(purge)
+    add_output_arg(purge, streaming=True)
 
     rename = tags_sub.add_parser("rename", help="Rename a tag across matched items")
     rename.add_argument("--old-name", required=True, help="Current tag name")
@@ -127,10 +126,10 @@ def _exit_code(payload: Any) -> int:
 def run(args: argparse.Namespace) -> int:
     load_config()
 
-    from zotero_mcp.services.data_access import DataAccessService
+    from zotero_mcp.services.data_access import get_data_service
     from zotero_mcp.services.zotero.maintenance_service import LibraryMaintenanceService
 
-    data_service = DataAccessService()
+    data_service = get_data_service()
     maintenance_service = LibraryMaintenanceService(data_service=data_service)
 
     async def _list_tags() -> dict[str, Any]:
@@ -216,6 +215,7 @@ def run(args: argparse.Namespace) -> int:
             scan_limit=args.scan_limit,
             update_limit=args.update_limit,
             dry_run=args.dry_run,
+            on_record=emit_stream(args),
         )
 
     async def _rename_tags() -> dict[str, Any]:
@@ -309,7 +309,7 @@ def run(args: argparse.Namespace) -> int:
     if handler is None:
         raise ValueError(f"Unknown tags subcommand: {args.subcommand}")
 
-    payload = asyncio.run(_await_handler(handler))
+    payload = run_coro(_await_handler(handler))
     emit(args, payload)
     return _exit_code(payload)
 
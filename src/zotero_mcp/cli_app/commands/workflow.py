@@ -3,27 +3,29 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
+from collections.abc import Awaitable, Callable
 import sys
 from typing import Any
 
 from zotero_mcp.cli_app.common import (
+    LazyArgumentParser,
     add_all_arg,
+    add_concurrency_arg,
+    add_lazy_parser,
     add_output_arg,
     add_scan_limit_arg,
     add_treated_limit_arg,
+    run_coro,
 )
 from zotero_mcp.cli_app.output import emit
 from zotero_mcp.utils.config import load_config
 
+# Fixed argparse choices, built once at import time.
+_LLM_PROVIDERS: tuple[str, ...] = ("auto", "deepseek")
+_TEMPLATE_CHOICES: tuple[str, ...] = ("research", "review", "book", "auto")
 
-def register(subparsers: argparse._SubParsersAction) -> None:
-    workflow = subparsers.add_parser("workflow", help="Batch workflow commands")
-    workflow_sub = workflow.add_subparsers(dest="subcommand", required=True)
 
-    item_analysis = workflow_sub.add_parser(
-        "item-analysis", help="Scan library and analyze items without AI notes"
-    )
+def _build_item_analysis_parser(item_analysis: argparse.ArgumentParser) -> None:
     add_scan_limit_arg(item_analysis, default=100)
     add_treated_limit_arg(
         item_analysis,
@@ -44,7 +46,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     )
     item_analysis.add_argument(
         "--llm-provider",
-        choices=["auto", "deepseek"],
+        choices=_LLM_PROVIDERS,
         default="deepseek",
         help="LLM provider for analysis (default: deepseek; auto selects by content)",
     )
@@ -55,15 +57,14 @@ def register(subparsers: argparse._SubParsersAction) -> None:
     )
     item_analysis.add_argument(
         "--template",
-        choices=["research", "review", "book", "auto"],
+        choices=_TEMPLATE_CHOICES,
         default="auto",
         help="Analysis template alias (default: auto; 'book' for books/chapters/encyclopedias)",
     )
     add_output_arg(item_analysis)
 
-    metadata = workflow_sub.add_parser(
-        "metadata-update", help="Update item metadata from external APIs"
-    )
+
+def _build_metadata_update_parser(metadata: argparse.ArgumentParser) -> None:
     metadata.add_argument("--collection", help="Limit to specific collection (by key)")
     add_scan_limit_arg(metadata, default=500)
     add_treated_limit_arg(
@@ -85,11 +86,11 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=False,
         help="Preview metadata updates without applying changes (default: disabled)",
     )
+    add_concurrency_arg(metadata, default=8)
     add_output_arg(metadata)
 
-    dedup = workflow_sub.add_parser(
-        "deduplicate", help="Find and remove duplicate items"
-    )
+
+def _build_deduplicate_parser(dedup: argparse.ArgumentParser) -> None:
     dedup.add_argument("--collection", help="Limit to specific collection (by key)")
     add_scan_limit_arg(dedup, default=500)
     add_treated_limit_arg(
@@ -104,8 +105,36 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         default=False,
         help="Preview duplicates without deleting (default: disabled)",
     )
+    add_concurrency_arg(dedup, default=8)
     add_output_arg(dedup)
 
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    workflow = subparsers.add_parser("workflow", help="Batch workflow commands")
+    workflow_sub = workflow.add_subparsers(
+        dest="subcommand", required=True, parser_class=LazyArgumentParser
+    )
+
+    add_lazy_parser(
+        workflow_sub,
+        "item-analysis",
+        _build_item_analysis_parser,
+        help="Scan library and analyze items without AI notes",
+    )
+    add_lazy_parser(
+        workflow_sub,
+        "metadata-update",
+        _build_metadata_update_parser,
+        help="Update item metadata from external APIs",
+    )
+    add_lazy_parser(
+        workflow_sub,
+        "deduplicate",
+        _build_deduplicate_parser,
+        help="Find and remove duplicate items",
+    )
+
+
 async def _run_item_analysis(args: argparse.Namespace) -> dict[str, Any]:
     from zotero_mcp.services.scanner import GlobalScanner
 
@@ -123,10 +152,10 @@ async def _run_item_analysis(args: argparse.Namespace) -> dict[str, Any]:
 
 
 async def _run_metadata_update(args: argparse.Namespace) -> dict[str, Any]:
-    from zotero_mcp.services.data_access import DataAccessService
+    from zotero_mcp.services.data_access import get_data_service
     from zotero_mcp.services.zotero.metadata_update_service import MetadataUpdateService
 
-    data_service = DataAccessService()
+    data_service = get_data_service()
     update_service = MetadataUpdateService(
         data_service.item_service,
         data_service.metadata_service,
@@ -142,23 +171,32 @@ async def _run_metadata_update(args: argparse.Namespace) -> dict[str, Any]:
         treated_limit=None if args.all else args.treated_limit,
         dry_run=args.dry_run,
         include_unfiled=args.include_unfiled,
+        concurrency=args.concurrency,
     )
 
 
 async def _run_deduplicate(args: argparse.Namespace) -> dict[str, Any]:
-    from zotero_mcp.services.data_access import DataAccessService
+    from zotero_mcp.services.data_access import get_data_service
     from zotero_mcp.services.zotero.duplicate_service import DuplicateDetectionService
 
-    data_service = DataAccessService()
+    data_service = get_data_service()
     service = DuplicateDetectionService(data_service.item_service)
     return await service.find_and_remove_duplicates(
         collection_key=args.collection,
         scan_limit=args.scan_limit,
         treated_limit=None if args.all else args.treated_limit,
         dry_run=args.dry_run,
+        concurrency=args.concurrency,
     )
 
 
+_HANDLERS: dict[str, Callable[[argparse.Namespace], Awaitable[dict[str, Any]]]] = {
+    "item-analysis": _run_item_analysis,
+    "metadata-update": _run_metadata_update,
+    "deduplicate": _run_deduplicate,
+}
+
+
 def _exit_code(result: dict[str, Any]) -> int:
     if result.get("error"):
         return 1
@@ -171,18 +209,12 @@ def _exit_code(result: dict[str, Any]) -> int:
 def run(args: argparse.Namespace) -> int:
     load_config()
 
-    handlers = {
-        "item-analysis": _run_item_analysis,
-        "metadata-update": _run_metadata_update,
-        "deduplicate": _run_deduplicate,
-    }
-
-    handler = handlers.get(args.subcommand)
+    handler = _HANDLERS.get(args.subcommand)
     if handler is None:
         print(f"Unknown workflow subcommand: {args.subcommand}", file=sys.stderr)
         return 1
 
-    result = asyncio.run(handler(args))
+    result = run_coro(handler(args))
     emit(args, result)
     return _exit_code(result)
 
@@ -3,6 +3,99 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+_cli_runner: asyncio.Runner | None = None
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the CLI event loop, preferring uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _close_cli_runner() -> None:
+    """Close the shared CLI runner, cancelling any tasks left pending."""
+    global _cli_runner
+    runner, _cli_runner = _cli_runner, None
+    if runner is not None:
+        runner.close()
+
+
+def run_coro[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a reusable CLI event loop.
+
+    Unlike ``asyncio.run``, the loop is kept open between calls so processes
+    that dispatch several commands do not rebuild an event loop each time.
+    It is shut down like ``asyncio.run`` would when the process exits.
+    """
+    global _cli_runner
+    if _cli_runner is None:
+        _cli_runner = asyncio.Runner(loop_factory=_new_event_loop)
+        atexit.register(_close_cli_runner)
+    return _cli_runner.run(coro)
+
+
+class LazyArgumentParser(argparse.ArgumentParser):
+    """Argument parser whose arguments are added on first use.
+
+    Subcommand parsers registered through ``add_lazy_parser`` defer their
+    ``add_argument`` calls until that subcommand is parsed or its help is
+    rendered, so unrelated subcommands cost nothing at startup.
+    """
+
+    _builder: Callable[[argparse.ArgumentParser], None] | None = None
+
+    def _materialize(self) -> None:
+        builder, self._builder = self._builder, None
+        if builder is not None:
+            builder(self)
+
+    def parse_known_args(  # type: ignore[override]
+        self,
+        args: Sequence[str] | None = None,
+        namespace: argparse.Namespace | None = None,
+    ) -> tuple[argparse.Namespace, list[str]]:
+        self._materialize()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self) -> str:
+        self._materialize()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self._materialize()
+        return super().format_help()
+
+
+def add_lazy_parser(
+    subparsers: argparse._SubParsersAction,
+    name: str,
+    builder: Callable[[argparse.ArgumentParser], None],
+    **kwargs: Any,
+) -> argparse.ArgumentParser:
+    """Register a subcommand whose arguments are built by ``builder`` on demand."""
+    parser = subparsers.add_parser(name, **kwargs)
+    if isinstance(parser, LazyArgumentParser):
+        parser._builder = builder
+    else:
+        builder(parser)
+    return parser
+
+
+# argparse expands %(default)s only when help is rendered, so these strings
+# are shared constants rather than formatted for every parser built.
+_SCAN_LIMIT_HELP = "Number of items to fetch per batch from API (default: %(default)s)"
+_TREATED_LIMIT_HELP = "Maximum total number of items to process"
 
 
 def _positive_int(value: str) -> int:
@@ -12,12 +105,17 @@ def _positive_int(value: str) -> int:
     return parsed
 
 
-def add_output_arg(parser: argparse.ArgumentParser) -> None:
+def add_output_arg(parser: argparse.ArgumentParser, streaming: bool = False) -> None:
+    choices = ["text", "json", "jsonl"] if streaming else ["text", "json"]
     parser.add_argument(
         "--output",
-        choices=["text", "json"],
+        choices=choices,
         default="text",
-        help="Output format (default: text)",
+        help=(
+            "Output format (default: text; jsonl streams one record per line)"
+            if streaming
+            else "Output format (default: text)"
+        ),
     )
 
 
@@ -26,7 +124,7 @@ def add_scan_limit_arg(parser: argparse.ArgumentParser, default: int) -> None:
         "--scan-limit",
         type=_positive_int,
         default=default,
-        help=f"Number of items to fetch per batch from API (default: {default})",
+        help=_SCAN_LIMIT_HELP,
     )
 
 
@@ -40,13 +138,22 @@ def add_treated_limit_arg(
             "--treated-limit",
             type=_positive_int,
             default=default,
-            help=help_text or "Maximum total number of items to process",
+            help=help_text or _TREATED_LIMIT_HELP,
         )
         return
     parser.add_argument(
         "--treated-limit",
         type=_positive_int,
-        help=help_text or "Maximum total number of items to process",
+        help=help_text or _TREATED_LIMIT_HELP,
+    )
+
+
+def add_concurrency_arg(parser: argparse.ArgumentParser, default: int) -> None:
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=default,
+        help="Maximum items processed at once (default: %(default)s)",
     )
 
 
@@ -9,8 +9,9 @@ from zotero_mcp.utils.config.logging import initialize_logging
 
 
 def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -3,36 +3,87 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Callable
 import json
+import sys
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Pass datetimes/dataclasses/subclasses through to ``default=str`` so the
+    # output matches the stdlib encoder below.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def dumps_json(payload: Any, pretty: bool = True) -> str:
+    """Serialize ``payload`` to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(payload, default=str, option=option).decode()
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False, default=str)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+
 
 def emit(args: argparse.Namespace, payload: Any) -> None:
     output = getattr(args, "output", "text")
     if output == "json":
-        print(json.dumps(payload, indent=2, ensure_ascii=False, default=str))
+        print(dumps_json(payload))
+        return
+    if output == "jsonl":
+        print(dumps_json(payload, pretty=False), flush=True)
         return
 
     _emit_text(payload)
 
 
+def emit_stream(args: argparse.Namespace) -> Callable[[Any], None] | None:
+    """Return a per-record JSON Lines writer, or None unless --output jsonl."""
+    if getattr(args, "output", "text") != "jsonl":
+        return None
+
+    def _write(record: Any) -> None:
+        print(dumps_json(record, pretty=False), flush=True)
+
+    return _write
+
+
 def _emit_text(payload: Any) -> None:
-    if payload is None:
-        return
-    if isinstance(payload, str):
-        print(payload)
-        return
-    if isinstance(payload, list):
-        for item in payload:
-            _emit_text(item)
-        return
-    if isinstance(payload, dict):
-        for key, value in payload.items():
-            if isinstance(value, (dict, list)):
-                print(f"{key}:")
-                print(json.dumps(value, indent=2, ensure_ascii=False, default=str))
-            else:
-                print(f"{key}: {value}")
-        return
+    # Nested lists are flattened with an explicit stack (children pushed in
+    # reverse to keep order) so deep payloads cannot hit the recursion limit.
+    # Lines are buffered and written once to avoid a print() per line.
+    lines: list[str] = []
+    stack: list[Any] = [payload]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node, str):
+            lines.append(node)
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    lines.append(f"{key}:")
+                    lines.append(dumps_json(value))
+                else:
+                    lines.append(f"{key}: {value}")
+        else:
+            lines.append(str(node))
 
-    print(payload)
+    if lines:
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
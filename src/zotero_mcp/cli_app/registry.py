@@ -3,48 +3,63 @@
 from __future__ import annotations
 
 import argparse
-from collections.abc import Callable
-
-from zotero_mcp.cli_app.commands import resources, semantic, system, tags, workflow
+from collections.abc import Callable, Sequence
+import importlib
+from types import ModuleType
 
 CommandRunner = Callable[[argparse.Namespace], int]
 
+_COMMANDS_PACKAGE = "zotero_mcp.cli_app.commands"
+
+# Top-level command -> (command module, register function, run function).
+# Modules are imported only when their command is registered or dispatched.
+_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "system": ("system", "register", "run"),
+    "workflow": ("workflow", "register", "run"),
+    "semantic": ("semantic", "register", "run"),
+    "tags": ("tags", "register", "run"),
+    "items": ("resources", "register_items", "run_items"),
+    "notes": ("resources", "register_notes", "run_notes"),
+    "annotations": ("resources", "register_annotations", "run_annotations"),
+    "pdfs": ("resources", "register_pdfs", "run_pdfs"),
+    "collections": ("resources", "register_collections", "run_collections"),
+}
+
+
+def _command_module(command: str) -> ModuleType:
+    module_name = _COMMANDS[command][0]
+    return importlib.import_module(f"{_COMMANDS_PACKAGE}.{module_name}")
+
 
-def build_parser() -> argparse.ArgumentParser:
+def _sniff_command(argv: Sequence[str]) -> str | None:
+    """Return the selected top-level command if it is the first argument."""
+    if argv and argv[0] in _COMMANDS:
+        return argv[0]
+    return None
+
+
+def build_parser(argv: Sequence[str] | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When ``argv`` names a known command first, only that command's module is
+    imported and registered; otherwise (help, errors, no argv) all are.
+    """
     parser = argparse.ArgumentParser(description="Zotero Model Context Protocol server")
     subparsers = parser.add_subparsers(dest="command")
 
-    registrars: tuple[Callable[[argparse._SubParsersAction], None], ...] = (
-        system.register,
-        workflow.register,
-        semantic.register,
-        tags.register,
-        resources.register_items,
-        resources.register_notes,
-        resources.register_annotations,
-        resources.register_pdfs,
-        resources.register_collections,
-    )
-    for register in registrars:
+    selected = _sniff_command(argv) if argv is not None else None
+    commands = (selected,) if selected is not None else tuple(_COMMANDS)
+    for command in commands:
+        register = getattr(_command_module(command), _COMMANDS[command][1])
         register(subparsers)
 
     return parser
 
 
 def dispatch(args: argparse.Namespace) -> int:
-    command_handlers: dict[str, CommandRunner] = {
-        "system": system.run,
-        "workflow": workflow.run,
-        "semantic": semantic.run,
-        "tags": tags.run,
-        "items": resources.run_items,
-        "notes": resources.run_notes,
-        "annotations": resources.run_annotations,
-        "pdfs": resources.run_pdfs,
-        "collections": resources.run_collections,
-    }
-
-    handler = command_handlers.get(args.command)
-    if handler is None:
+    if args.command not in _COMMANDS:
         raise ValueError(f"Unknown command: {args.command}")
+    handler: CommandRunner = getattr(
+        _command_module(args.command), _COMMANDS[args.command][2]
+    )
     return handler(args)
@@ -1,14 +1,45 @@
 """External service clients organized by domain."""
 
-from .database import ChromaClient, create_chroma_client
-from .llm import CLILLMClient, get_llm_client
-from .metadata import CrossrefClient, OpenAlexClient
-from .zotero import (
-    LocalDatabaseClient,
-    ZoteroAPIClient,
-    get_local_database_client,
-    get_zotero_client,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zotero_mcp.utils._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .database import ChromaClient, create_chroma_client
+    from .llm import CLILLMClient, get_llm_client
+    from .metadata import CrossrefClient, OpenAlexClient
+    from .zotero import (
+        LocalDatabaseClient,
+        ZoteroAPIClient,
+        get_local_database_client,
+        get_zotero_client,
+    )
+
+# Re-exported name -> defining subpackage. Resolved on first access so that
+# importing one client (e.g. ``clients.zotero``) does not pull in the others'
+# heavy dependencies such as chromadb.
+_LAZY_EXPORTS: dict[str, str] = {
+    # Zotero
+    "ZoteroAPIClient": ".zotero",
+    "get_zotero_client": ".zotero",
+    "LocalDatabaseClient": ".zotero",
+    "get_local_database_client": ".zotero",
+    # Database
+    "ChromaClient": ".database",
+    "create_chroma_client": ".database",
+    # Metadata
+    "CrossrefClient": ".metadata",
+    "OpenAlexClient": ".metadata",
+    # LLM
+    "get_llm_client": ".llm",
+    "CLILLMClient": ".llm",
+}
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     # Zotero
@@ -11,6 +11,7 @@ from functools import lru_cache
 import os
 from typing import Any, Literal
 
+import httpx
 from pyzotero import zotero
 
 from zotero_mcp.utils.config.logging import get_logger
@@ -27,6 +28,11 @@ from zotero_mcp.utils.system.errors import (
 
 logger = get_logger(__name__)
 
+# Zotero Web API accepts at most 50 objects per write request.
+WRITE_BATCH_SIZE = 50
+# ...and at most 50 keys in an itemKey filter.
+ITEM_KEY_BATCH_SIZE = 50
+
 
 @dataclass
 class AttachmentInfo:
@@ -212,6 +218,29 @@ class ZoteroAPIClient:
                 raise NotFoundError(f"Item not found: {item_key}") from e
             raise
 
+    async def get_items_by_keys(self, item_keys: list[str]) -> list[dict[str, Any]]:
+        """
+        Get multiple items by key with one request per 50 keys.
+
+        Args:
+            item_keys: Zotero item keys
+
+        Returns:
+            Items found; keys that do not exist are simply absent
+        """
+        loop = asyncio.get_event_loop()
+
+        def fetch_all() -> list[dict[str, Any]]:
+            items: list[dict[str, Any]] = []
+            for start in range(0, len(item_keys), ITEM_KEY_BATCH_SIZE):
+                batch = item_keys[start : start + ITEM_KEY_BATCH_SIZE]
+                items.extend(
+                    self.client.items(itemKey=",".join(batch), limit=len(batch))
+                )
+            return items
+
+        return await loop.run_in_executor(None, fetch_all)
+
     async def get_item_children(
         self,
         item_key: str,
@@ -439,7 +468,7 @@ class ZoteroAPIClient:
 
     async def get_items_by_tag(
         self,
-        tag: str,
+        tag: str | list[str],
         limit: int = 100,
         start: int = 0,
     ) -> list[dict[str, Any]]:
@@ -447,7 +476,8 @@ class ZoteroAPIClient:
         Get items with a specific tag.
 
         Args:
-            tag: Tag name
+            tag: Tag name, or several tag filters that must all match; a
+                leading "-" excludes items with that tag
             limit: Maximum results
             start: Pagination offset
 
@@ -760,6 +790,60 @@ class ZoteroAPIClient:
             None, lambda: self.client.delete_item(payload)
         )
 
+    def _send_write(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Send a library write request and return its response.
+
+        pyzotero's batch writes only expose the response through the shared
+        ``client.request`` attribute, which concurrent executor calls can
+        overwrite, so batch writes go through its HTTP client directly.
+        Backoff and error handling mirror pyzotero's own write methods.
+        """
+        zot = self.client
+        zot._check_backoff()
+        response = zot.client.request(
+            method,
+            zotero.build_url(
+                zot.endpoint, f"/{zot.library_type}/{zot.library_id}{path}"
+            ),
+            **kwargs,
+        )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            zotero.error_handler(zot, response, exc)
+        backoff = response.headers.get("backoff") or response.headers.get("retry-after")
+        if backoff:
+            zot._set_backoff(backoff)
+        return response
+
+    async def delete_items(self, item_keys: list[str]) -> None:
+        """
+        Delete multiple items (moves to trash) in batches of 50 keys.
+
+        Args:
+            item_keys: Item keys to delete
+
+        Raises:
+            Exception: If a batch request fails; earlier batches stay deleted
+        """
+        loop = asyncio.get_event_loop()
+
+        def delete_all() -> None:
+            # Multi-item deletes are guarded by the library version, which
+            # each successful delete response advances.
+            version = self.client.last_modified_version()
+            for start in range(0, len(item_keys), WRITE_BATCH_SIZE):
+                batch = item_keys[start : start + WRITE_BATCH_SIZE]
+                response = self._send_write(
+                    "DELETE",
+                    "/items",
+                    params={"itemKey": ",".join(batch)},
+                    headers={"If-Unmodified-Since-Version": str(version)},
+                )
+                version = int(response.headers.get("last-modified-version", version))
+
+        await loop.run_in_executor(None, delete_all)
+
     async def add_tags(self, item_key: str, tags: list[str]) -> dict[str, Any]:
         """
         Add tags to an item (preserves existing tags).
@@ -802,6 +886,43 @@ class ZoteroAPIClient:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, lambda: self.client.update_item(item))
 
+    async def update_items(self, items: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Update multiple items in batches of 50.
+
+        Args:
+            items: Complete item objects with modifications
+
+        Returns:
+            Mapping of item key to error message for items the API rejected
+
+        Raises:
+            Exception: If a batch request fails as a whole
+        """
+        loop = asyncio.get_event_loop()
+
+        def update_all() -> dict[str, str]:
+            failed: dict[str, str] = {}
+            for start in range(0, len(items), WRITE_BATCH_SIZE):
+                batch = items[start : start + WRITE_BATCH_SIZE]
+                response = self._send_write(
+                    "POST", "/items", json=self.client.check_items(batch)
+                )
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = None
+                if not isinstance(body, dict):
+                    body = {}
+                batch_failed = body.get("failed") or {}
+                for index, error in batch_failed.items():
+                    item = batch[int(index)]
+                    key = item.get("key") or item.get("data", {}).get("key", "")
+                    failed[key] = str(error.get("message", error))
+            return failed
+
+        return await loop.run_in_executor(None, update_all)
+
 
 @lru_cache(maxsize=1)
 def get_zotero_client() -> ZoteroAPIClient:
@@ -383,6 +383,7 @@ class LocalDatabaseClient:
         self,
         query: str,
         limit: int = 50,
+        offset: int = 0,
     ) -> list[ZoteroItem]:
         """
         Simple text search through items.
@@ -390,6 +391,7 @@ class LocalDatabaseClient:
         Args:
             query: Search query
             limit: Maximum results
+            offset: Number of leading matches to skip
 
         Returns:
             Matching items
@@ -397,10 +399,14 @@ class LocalDatabaseClient:
         items = self.get_items()
         query_lower = query.lower()
         matches = []
+        skipped = 0
 
         for item in items:
             text = item.get_searchable_text().lower()
             if query_lower in text:
+                if skipped < offset:
+                    skipped += 1
+                    continue
                 matches.append(item)
                 if len(matches) >= limit:
                     break
@@ -31,6 +31,7 @@ class MetadataUpdateBatchParams(BaseModel):
     scan_limit: int = Field(default=100, ge=1)
     treated_limit: int | None = Field(default=None, ge=1)
     dry_run: bool = Field(default=False)
+    concurrency: int = Field(default=8, ge=1)
 
 
 class DuplicateScanParams(BaseModel):
@@ -42,3 +43,4 @@ class DuplicateScanParams(BaseModel):
     scan_limit: int = Field(default=500, ge=1)
     treated_limit: int | None = Field(default=1000, ge=1)
     dry_run: bool = Field(default=False)
+    concurrency: int = Field(default=8, ge=1)
@@ -6,7 +6,6 @@ import asyncio
 import os
 from typing import Any
 
-from zotero_mcp.handlers import PromptHandler, ToolHandler
 from zotero_mcp.settings import settings
 from zotero_mcp.utils.config import load_config
 from zotero_mcp.utils.config.logging import initialize_logging
@@ -74,6 +73,9 @@ async def serve() -> None:
     initialize_logging()
     load_config()
 
+    # Deferred so importing this module does not load every tool implementation.
+    from zotero_mcp.handlers import PromptHandler, ToolHandler
+
     tool_handler = ToolHandler()
     prompt_handler = PromptHandler()
 
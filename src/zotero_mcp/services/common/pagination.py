@@ -1,5 +1,6 @@
 """Shared pagination helpers for async offset-based scanning."""
 
+import asyncio
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
@@ -9,6 +10,7 @@ async def iter_offset_batches(
     *,
     batch_size: int,
     start: int = 0,
+    prefetch: bool = False,
 ) -> AsyncIterator[tuple[int, list[Any]]]:
     """
     Yield paged results using offset + limit semantics.
@@ -16,16 +18,38 @@ async def iter_offset_batches(
     Stops when:
     - page is empty, or
     - returned page size is smaller than requested batch_size.
+
+    With ``prefetch=True`` the next full page is requested before the current
+    one is yielded, overlapping API latency with the caller's processing.
+    Only use it when processing does not change which items later pages hold.
     """
     offset = start
-    while True:
-        page = await fetch_page(offset, batch_size)
-        if not page:
-            return
+    next_page: asyncio.Future[list[Any]] | None = None
+    try:
+        while True:
+            if next_page is None:
+                page = await fetch_page(offset, batch_size)
+            else:
+                page, next_page = await next_page, None
+            if not page:
+                return
+
+            if prefetch and len(page) >= batch_size:
+                next_page = asyncio.ensure_future(
+                    fetch_page(offset + batch_size, batch_size)
+                )
 
-        yield offset, page
+            yield offset, page
 
-        if len(page) < batch_size:
-            return
+            if len(page) < batch_size:
+                return
 
-        offset += batch_size
+            offset += batch_size
+    finally:
+        # Caller stopped early: drop the unused prefetch without leaking an
+        # unretrieved exception.
+        if next_page is not None:
+            if next_page.done() and not next_page.cancelled():
+                next_page.exception()
+            else:
+                next_page.cancel()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
+import random
 
 
 async def async_retry_with_backoff[T](
@@ -13,6 +14,8 @@ async def async_retry_with_backoff[T](
     base_delay: float = 1.0,
     max_delay: float = 10.0,
     description: str | None = None,
+    jitter: bool = True,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
 ) -> T:
     """Retry an async callable with exponential backoff.
 
@@ -21,17 +24,23 @@ async def async_retry_with_backoff[T](
         retries: Number of retries before raising.
         base_delay: Initial delay in seconds.
         max_delay: Maximum delay between retries.
+        jitter: Sleep a random duration up to the backoff delay ("full
+            jitter") so concurrent callers do not retry in lockstep.
+        retry_on: Exception types that trigger a retry; others propagate
+            immediately.
     """
     _ = description
-    last_error: Exception | None = None
+    last_error: BaseException | None = None
     for attempt in range(retries + 1):
         try:
             return await func()
-        except Exception as exc:  # pragma: no cover - exercised by callers
+        except retry_on as exc:  # pragma: no cover - exercised by callers
             last_error = exc
             if attempt >= retries:
                 break
-            delay = min(max_delay, base_delay * (2**attempt))
+            delay = min(max_delay, base_delay * (1 << attempt))
+            if jitter:
+                delay = random.uniform(0, delay)
             await asyncio.sleep(delay)
     assert last_error is not None
     raise last_error
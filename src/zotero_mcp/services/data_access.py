@@ -108,6 +108,7 @@ class DataAccessService:
                 api_client=self.api_client,
                 local_client=self.local_client,
             )
+            self.item_service.add_write_listener(self._search_service.clear_cache)
         return self._search_service
 
     @property
@@ -164,6 +165,13 @@ class DataAccessService:
         """Get item by key."""
         return await self.item_service.get_item(item_key)
 
+    async def get_items_by_keys(
+        self,
+        item_keys: list[str],
+    ) -> list[dict[str, Any]]:
+        """Get multiple items by key, batching requests."""
+        return await self.item_service.get_items_by_keys(item_keys)
+
     async def get_all_items(
         self,
         limit: int = 100,
@@ -297,6 +305,10 @@ class DataAccessService:
         """Delete an item."""
         return await self.item_service.delete_item(item_key)
 
+    async def delete_items(self, item_keys: list[str]) -> None:
+        """Delete multiple items in batches."""
+        await self.item_service.delete_items(item_keys)
+
     async def add_tags_to_item(self, item_key: str, tags: list[str]) -> dict[str, Any]:
         """Add tags to an item."""
         return await self.item_service.add_tags_to_item(item_key, tags)
@@ -305,6 +317,10 @@ class DataAccessService:
         """Update an item's data."""
         return await self.item_service.update_item(item)
 
+    async def update_items(self, items: list[dict[str, Any]]) -> dict[str, str]:
+        """Update multiple items in batches; returns per-key failures."""
+        return await self.item_service.update_items(items)
+
     async def create_items(self, items: list[dict[str, Any]]) -> dict[str, Any]:
         """Create new items."""
         return await self.item_service.create_items(items)
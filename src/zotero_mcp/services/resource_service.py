@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import html
 from pathlib import Path
 import re
 from typing import Any, Literal
 
-from zotero_mcp.services.data_access import DataAccessService
+from pydantic import TypeAdapter
+
+from zotero_mcp.models.common import SearchResultItem
+from zotero_mcp.services.data_access import DataAccessService, get_data_service
 from zotero_mcp.services.zotero.note_relation_service import NoteRelationService
 
+# Max concurrent per-item child fetches during note search.
+NOTE_SEARCH_CONCURRENCY = 10
+# Zotero write API accepts at most 50 items per request.
+CREATE_ITEMS_BATCH_SIZE = 50
+
+# Dumps a whole result page in one pydantic-core call instead of one
+# model_dump() per item.
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(list[SearchResultItem])
+
 
 class ResourceService:
     """Business operations for item/note/annotation/pdf/collection commands."""
 
     def __init__(self, data_service: DataAccessService | None = None):
-        self.data_service = data_service or DataAccessService()
+        self.data_service = data_service or get_data_service()
 
     # -------------------- Item operations --------------------
 
@@ -33,7 +46,10 @@ class ResourceService:
             start=offset,
             item_type=item_type,
         )
-        return {"count": len(results), "items": [item.model_dump() for item in results]}
+        return {
+            "count": len(results),
+            "items": _SEARCH_RESULTS_ADAPTER.dump_python(results),
+        }
 
     async def list_item_children(
         self,
@@ -73,7 +89,39 @@ class ResourceService:
         self, payload: dict[str, Any] | list[dict[str, Any]]
     ) -> dict[str, Any]:
         items = payload if isinstance(payload, list) else [payload]
-        return await self.data_service.create_items(items)
+        if len(items) <= CREATE_ITEMS_BATCH_SIZE:
+            return await self.data_service.create_items(items)
+
+        merged: dict[str, Any] = {}
+        for start in range(0, len(items), CREATE_ITEMS_BATCH_SIZE):
+            batch = items[start : start + CREATE_ITEMS_BATCH_SIZE]
+            result = await self.data_service.create_items(batch)
+            self._merge_create_result(merged, result, offset=start)
+        return merged
+
+    @staticmethod
+    def _merge_create_result(merged: dict[str, Any], result: Any, offset: int) -> None:
+        """Fold one batch's create result into ``merged``.
+
+        Index-keyed maps (``successful``/``failed``/...) hold positions in
+        the batch (``ItemService`` maps them back past skipped duplicates),
+        so they are re-keyed by the batch offset to refer to positions in
+        the full input list; integer counters are summed.
+        """
+        if not isinstance(result, dict):
+            return
+        for key, value in result.items():
+            if isinstance(value, dict):
+                bucket = merged.setdefault(key, {})
+                for index, entry in value.items():
+                    index_str = str(index)
+                    if index_str.isdigit():
+                        index_str = str(int(index_str) + offset)
+                    bucket[index_str] = entry
+            elif isinstance(value, int) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+            else:
+                merged[key] = value
 
     async def add_tags_to_item(self, item_key: str, tags: list[str]) -> dict[str, Any]:
         return await self.data_service.add_tags_to_item(item_key, tags)
@@ -121,14 +169,22 @@ class ResourceService:
             qmode="everything",
         )
         hits: list[dict[str, Any]] = []
-        query_lower = query.lower()
+        query_re = re.compile(re.escape(query), re.IGNORECASE)
+        semaphore = asyncio.Semaphore(NOTE_SEARCH_CONCURRENCY)
 
-        for item in candidates:
-            notes = await self.data_service.get_notes(item.key)
+        async def _fetch_notes(item_key: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.data_service.get_notes(item_key)
+
+        notes_by_item = await asyncio.gather(
+            *(_fetch_notes(item.key) for item in candidates)
+        )
+
+        for item, notes in zip(candidates, notes_by_item, strict=True):
             for note in notes:
                 data = note.get("data", {})
                 raw_note = str(data.get("note", ""))
-                if query_lower in raw_note.lower():
+                if query_re.search(raw_note):
                     hits.append(
                         {
                             "item_key": item.key,
@@ -558,4 +614,7 @@ class ResourceService:
             limit=limit,
             start=offset,
         )
-        return {"count": len(results), "items": [item.model_dump() for item in results]}
+        return {
+            "count": len(results),
+            "items": _SEARCH_RESULTS_ADAPTER.dump_python(results),
+        }
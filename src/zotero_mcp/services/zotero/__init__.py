@@ -1,9 +1,27 @@
 """Zotero backend services."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zotero_mcp.utils._lazy import lazy_getattr
+
 from .item_service import ItemService
 from .metadata_service import MetadataService
 from .search_service import SearchService
-from .semantic_search import ZoteroSemanticSearch
+
+if TYPE_CHECKING:
+    from .semantic_search import ZoteroSemanticSearch
+
+# Resolved on first access: semantic search pulls in chromadb, which the
+# other services do not need.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ZoteroSemanticSearch": ".semantic_search",
+}
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "ItemService",
@@ -7,6 +7,7 @@ DOI, title, and URL matching with configurable priority.
 Note: Duplicate items are PERMANENTLY deleted (not moved to trash).
 """
 
+import asyncio
 from collections import defaultdict
 from dataclasses import dataclass, field
 import logging
@@ -31,6 +32,7 @@ from zotero_mcp.utils.formatting.helpers import clean_title
 logger = logging.getLogger(__name__)
 
 _ZOTERO_API_MAX_PAGE_SIZE = 100
+_DEFAULT_CONCURRENCY = 8
 
 
 @dataclass
@@ -99,6 +101,7 @@ class DuplicateDetectionService:
         scan_limit: int = 500,
         treated_limit: int | None = 1000,
         dry_run: bool = False,
+        concurrency: int = _DEFAULT_CONCURRENCY,
     ) -> dict[str, Any]:
         """
         Find and remove duplicate items.
@@ -108,6 +111,7 @@ class DuplicateDetectionService:
             scan_limit: Number of items to fetch per batch from API
             treated_limit: Maximum total number of duplicate items to find
             dry_run: If True, don't actually delete items
+            concurrency: Maximum duplicate items deleted at once
 
         Returns:
             Dict with scan statistics and duplicate groups
@@ -118,6 +122,7 @@ class DuplicateDetectionService:
                 scan_limit=scan_limit,
                 treated_limit=treated_limit,
                 dry_run=dry_run,
+                concurrency=concurrency,
             )
         except ValidationError as e:
             logger.error(f"Invalid dedup parameters: {e}")
@@ -210,7 +215,7 @@ class DuplicateDetectionService:
 
         # Remove duplicates (permanently delete)
         duplicates_removed, delete_failures = await self._remove_duplicates(
-            duplicate_groups
+            duplicate_groups, concurrency=params.concurrency
         )
 
         logger.info(
@@ -258,6 +263,7 @@ class DuplicateDetectionService:
         async for offset, items in iter_offset_batches(
             self._make_collection_batch_fetcher(coll_key),
             batch_size=batch_size,
+            prefetch=True,
         ):
             batch_items = [_item_to_dict(item) for item in items]
             parent_items = [item for item in batch_items if self._is_parent_item(item)]
@@ -282,6 +288,7 @@ class DuplicateDetectionService:
         async for offset, items in iter_offset_batches(
             self._make_library_batch_fetcher(),
             batch_size=batch_size,
+            prefetch=True,
         ):
             batch_items = [_item_to_dict(item) for item in items]
             parent_items = [item for item in batch_items if self._is_parent_item(item)]
@@ -409,13 +416,22 @@ class DuplicateDetectionService:
         already_grouped = existing_primary_keys | existing_duplicate_keys
         candidate_items = [item for item in items if self._is_parent_item(item)]
 
+        # Normalize DOI and title once per item; every pass below reuses them.
+        match_fields: dict[int, tuple[str, str]] = {}
+        for item in candidate_items:
+            data = item.get("data", {})
+            match_fields[id(item)] = (
+                _normalize_doi(data.get("DOI")),
+                clean_title(data.get("title", "")).lower(),
+            )
+
         # Group by DOI (highest priority)
         doi_groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
         for item in candidate_items:
             item_key = item.get("key", "")
             if item_key in already_grouped:
                 continue
-            doi = _normalize_doi(item.get("data", {}).get("DOI"))
+            doi = match_fields[id(item)][0]
             if doi:
                 doi_groups[doi].append(item)
 
@@ -432,21 +448,23 @@ class DuplicateDetectionService:
             item_key = item.get("key", "")
             if item_key in processed_keys:
                 continue
-            title = clean_title(item.get("data", {}).get("title", "")).lower()
+            title = match_fields[id(item)][1]
             if title:
                 title_groups[title].append(item)
 
         # Track keys matched by title
-        for items_list in title_groups.values():
+        conflicting_titles: set[str] = set()
+        for title, items_list in title_groups.items():
             if len(items_list) <= 1:
                 continue
             normalized_dois = {
-                _normalize_doi(item.get("data", {}).get("DOI"))
+                match_fields[id(item)][0]
                 for item in items_list
-                if _normalize_doi(item.get("data", {}).get("DOI"))
+                if match_fields[id(item)][0]
             }
             if len(normalized_dois) > 1:
                 # Do not deduplicate by title when explicit DOI conflicts.
+                conflicting_titles.add(title)
                 continue
             for item in items_list:
                 processed_keys.add(item.get("key", ""))
@@ -459,7 +477,7 @@ class DuplicateDetectionService:
             if item_key in processed_keys:
                 continue
             url = _normalize_url(item.get("data", {}).get("url"))
-            title = clean_title(item.get("data", {}).get("title", "")).lower()
+            title = match_fields[id(item)][1]
             if url and title:
                 url_groups[(url, title)].append(item)
 
@@ -475,15 +493,9 @@ class DuplicateDetectionService:
             for match_key, items_list in groups.items():
                 if len(items_list) <= 1:
                     continue
-                if match_reason == "title":
-                    normalized_dois = {
-                        _normalize_doi(item.get("data", {}).get("DOI"))
-                        for item in items_list
-                        if _normalize_doi(item.get("data", {}).get("DOI"))
-                    }
-                    if len(normalized_dois) > 1:
-                        # Same title but conflicting DOIs: treat as distinct papers.
-                        continue
+                if match_reason == "title" and match_key in conflicting_titles:
+                    # Same title but conflicting DOIs: treat as distinct papers.
+                    continue
                 match_value = self._format_match_value(match_reason, match_key)
                 group = self._create_duplicate_group(
                     items_list, match_reason=match_reason, match_value=match_value
@@ -702,13 +714,14 @@ class DuplicateDetectionService:
     async def _remove_duplicates(
         self,
         duplicate_groups: list[DuplicateGroup],
+        concurrency: int = _DEFAULT_CONCURRENCY,
     ) -> tuple[int, int]:
         """Remove duplicate items by permanently deleting them."""
-        deleted_count = 0
-        failed_count = 0
+        semaphore = asyncio.Semaphore(concurrency)
 
-        for group in duplicate_groups:
-            for dup_key in group.duplicate_keys:
+        async def _remove(group: DuplicateGroup, dup_key: str) -> bool | None:
+            """Return True if deleted, False on failure, None if preserved."""
+            async with semaphore:
                 try:
                     item = await self.item_service.api_client.get_item(dup_key)
                     item_type = item.get("data", {}).get("itemType", "")
@@ -718,18 +731,27 @@ class DuplicateDetectionService:
                             f"  ⊘ Skipping {item_type.upper()} {dup_key} "
                             f"({item_type}s are preserved)"
                         )
-                        continue
+                        return None
 
                     await async_retry_with_backoff(
-                        lambda k=dup_key: self.item_service.api_client.delete_item(k),
+                        lambda: self.item_service.delete_item(dup_key),
                         description=f"Delete duplicate item {dup_key}",
                     )
                     logger.info(
                         f"  ✓ Deleted ITEM {dup_key} (matched by {group.match_reason})"
                     )
-                    deleted_count += 1
+                    return True
                 except Exception as e:
                     logger.error(f"  Failed to delete {dup_key}: {e}")
-                    failed_count += 1
+                    return False
 
+        results = await asyncio.gather(
+            *(
+                _remove(group, dup_key)
+                for group in duplicate_groups
+                for dup_key in group.duplicate_keys
+            )
+        )
+        deleted_count = sum(1 for result in results if result is True)
+        failed_count = sum(1 for result in results if result is False)
         return deleted_count, failed_count
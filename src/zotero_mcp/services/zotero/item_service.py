@@ -5,6 +5,7 @@ Handles CRUD operations for Zotero items, collections, and tags.
 """
 
 import asyncio
+from collections.abc import Callable
 import logging
 import os
 import re
@@ -69,6 +70,19 @@ def _normalize_title(raw_title: str | None) -> str:
     return title
 
 
+def _remap_indices(
+    index_map: dict[str, Any], kept_indices: list[int]
+) -> dict[str, Any]:
+    """Re-key a create-result map from filtered positions to input positions."""
+    remapped: dict[str, Any] = {}
+    for index, entry in index_map.items():
+        position = str(index)
+        if position.isdigit() and int(position) < len(kept_indices):
+            position = str(kept_indices[int(position)])
+        remapped[position] = entry
+    return remapped
+
+
 def _extract_year(raw_date: str | None) -> str:
     """Extract publication year from Zotero date string."""
     if not raw_date:
@@ -98,6 +112,18 @@ class ItemService:
         self.local_client = local_client
         # Internal cache for slow, infrequent changing data (collections, tags)
         self._cache = ResponseCache(ttl_seconds=300)
+        # Called after item writes so dependent caches (e.g. search) are dropped
+        self._write_listeners: list[Callable[[], None]] = []
+
+    def add_write_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run after any item write."""
+        self._write_listeners.append(callback)
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached reads after an item write."""
+        self._cache.clear()
+        for callback in self._write_listeners:
+            callback()
 
     # -------------------- Item Operations --------------------
 
@@ -105,6 +131,10 @@ class ItemService:
         """Get item by key."""
         return await self.api_client.get_item(item_key)
 
+    async def get_items_by_keys(self, item_keys: list[str]) -> list[dict[str, Any]]:
+        """Get multiple items by key, batching requests."""
+        return await self.api_client.get_items_by_keys(item_keys)
+
     async def get_all_items(
         self,
         limit: int = 100,
@@ -334,7 +364,9 @@ class ItemService:
         self, parent_key: str, content: str, tags: list[str] | None = None
     ) -> dict[str, Any]:
         """Create a note attached to an item."""
-        return await self.api_client.create_note(parent_key, content, tags)
+        result = await self.api_client.create_note(parent_key, content, tags)
+        self._invalidate_caches()
+        return result
 
     # -------------------- Item Management --------------------
 
@@ -342,40 +374,62 @@ class ItemService:
         self, collection_key: str, item_key: str
     ) -> dict[str, Any]:
         """Add an item to a collection."""
-        return await self.api_client.add_to_collection(collection_key, item_key)
+        result = await self.api_client.add_to_collection(collection_key, item_key)
+        self._invalidate_caches()
+        return result
 
     async def remove_item_from_collection(
         self, collection_key: str, item_key: str
     ) -> dict[str, Any]:
         """Remove an item from a collection."""
-        return await self.api_client.remove_from_collection(collection_key, item_key)
+        result = await self.api_client.remove_from_collection(collection_key, item_key)
+        self._invalidate_caches()
+        return result
 
     async def delete_item(self, item_key: str) -> dict[str, Any]:
         """Delete an item."""
-        return await self.api_client.delete_item(item_key)
+        result = await self.api_client.delete_item(item_key)
+        self._invalidate_caches()
+        return result
+
+    async def delete_items(self, item_keys: list[str]) -> None:
+        """Delete multiple items using batched requests."""
+        try:
+            await self.api_client.delete_items(item_keys)
+        finally:
+            # Earlier batches may have been deleted even if a later one failed.
+            self._invalidate_caches()
 
     async def add_tags_to_item(self, item_key: str, tags: list[str]) -> dict[str, Any]:
         """Add tags to an item."""
         result = await self.api_client.add_tags(item_key, tags)
-        self._cache.clear()
+        self._invalidate_caches()
         return result
 
     async def upload_attachment(
         self, parent_key: str, file_path: str, title: str | None = None
     ) -> dict[str, Any]:
         """Upload a local file and attach it to an item."""
-        return await self.api_client.upload_attachment(
+        result = await self.api_client.upload_attachment(
             parent_key=parent_key,
             file_path=file_path,
             title=title,
         )
+        self._invalidate_caches()
+        return result
 
     async def update_item(self, item: dict[str, Any]) -> dict[str, Any]:
         """Update an item's data."""
         result = await self.api_client.update_item(item)
-        self._cache.clear()
+        self._invalidate_caches()
         return result
 
+    async def update_items(self, items: list[dict[str, Any]]) -> dict[str, str]:
+        """Update multiple items using batched requests."""
+        failed = await self.api_client.update_items(items)
+        self._invalidate_caches()
+        return failed
+
     async def create_items(self, items: list[dict[str, Any]]) -> dict[str, Any]:
         """Create new items."""
         if not items:
@@ -393,9 +447,13 @@ class ItemService:
             "yes",
         }
         if not dedup_enabled:
-            return await self.api_client.create_items(items)
+            result = await self.api_client.create_items(items)
+            self._invalidate_caches()
+            return result
 
-        filtered_items, skipped_count = await self._filter_items_before_create(items)
+        kept_indices = await self._filter_items_before_create(items)
+        filtered_items = [items[index] for index in kept_indices]
+        skipped_count = len(items) - len(kept_indices)
         if not filtered_items:
             logger.info(
                 f"Skipped all {len(items)} items as duplicates before create"
@@ -409,6 +467,7 @@ class ItemService:
             }
 
         result = await self.api_client.create_items(filtered_items)
+        self._invalidate_caches()
         if not isinstance(result, dict):
             return {
                 "successful": {},
@@ -418,6 +477,13 @@ class ItemService:
                 "skipped_duplicates": skipped_count,
             }
 
+        # The API indexes results by position in the filtered list; report
+        # them by position in the caller's input instead.
+        for name in ("successful", "success", "unchanged", "failed"):
+            index_map = result.get(name)
+            if isinstance(index_map, dict):
+                result[name] = _remap_indices(index_map, kept_indices)
+
         successful = result.get("successful", {})
         failed = result.get("failed", {})
         created = len(successful) if isinstance(successful, dict) else 0
@@ -441,21 +507,23 @@ class ItemService:
 
     async def _filter_items_before_create(
         self, items: list[dict[str, Any]]
-    ) -> tuple[list[dict[str, Any]], int]:
+    ) -> list[int]:
         """
         Filter out probable duplicates before creating new items.
 
         Priority: DOI > URL > title (+year when available).
+
+        Returns:
+            Indices into ``items`` of the items to create, in input order
         """
-        filtered: list[dict[str, Any]] = []
-        skipped_count = 0
+        kept_indices: list[int] = []
 
         seen_doi: set[str] = set()
         seen_url: set[str] = set()
         seen_title_year: set[tuple[str, str]] = set()
         search_cache: dict[tuple[str, str, int], list[dict[str, Any]]] = {}
 
-        for item in items:
+        for index, item in enumerate(items):
             data = item.get("data", item) if isinstance(item, dict) else {}
 
             doi = _normalize_doi(data.get("DOI"))
@@ -465,23 +533,19 @@ class ItemService:
 
             # Intra-batch duplicate check.
             if doi and doi in seen_doi:
-                skipped_count += 1
                 continue
             if url and url in seen_url:
-                skipped_count += 1
                 continue
             if title and (title, year) in seen_title_year:
-                skipped_count += 1
                 continue
 
             # Library-level duplicate check.
             if await self._exists_duplicate_in_library(
                 doi, url, title, year, search_cache
             ):
-                skipped_count += 1
                 continue
 
-            filtered.append(item)
+            kept_indices.append(index)
             if doi:
                 seen_doi.add(doi)
             if url:
@@ -489,7 +553,7 @@ class ItemService:
             if title:
                 seen_title_year.add((title, year))
 
-        return filtered, skipped_count
+        return kept_indices
 
     async def _exists_duplicate_in_library(
         self,
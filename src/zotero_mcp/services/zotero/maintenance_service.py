@@ -2,23 +2,250 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from contextlib import aclosing
 from typing import Any
 
-from zotero_mcp.services.data_access import DataAccessService
+from zotero_mcp.services.common.pagination import iter_offset_batches
+from zotero_mcp.services.data_access import DataAccessService, get_data_service
 from zotero_mcp.utils.formatting.tags import (
     normalize_input_tags,
     normalize_tag_names,
     to_tag_objects,
 )
+from zotero_mcp.utils.system.errors import NotFoundError
+
+# Receives each candidate/detail record as soon as it is decided.
+RecordCallback = Callable[[dict[str, Any]], None]
 
 
 class LibraryMaintenanceService:
     """Service layer for clean-empty and clean-tags workflows."""
 
-    _SKIPPED_CHILD_TYPES = {"attachment", "note", "annotation"}
+    _SKIPPED_CHILD_TYPES = frozenset({"attachment", "note", "annotation"})
+    # Max concurrent per-item API requests within one page.
+    _REQUEST_CONCURRENCY = 10
+    # Max collections scanned at once by clean-empty; each may also have
+    # _REQUEST_CONCURRENCY children lookups in flight.
+    _COLLECTION_CONCURRENCY = 4
+    # Zotero Web API accepts at most 50 objects per write request.
+    _WRITE_BATCH_SIZE = 50
 
     def __init__(self, data_service: DataAccessService | None = None):
-        self.data_service = data_service or DataAccessService()
+        self.data_service = data_service or get_data_service()
+
+    @staticmethod
+    def _full_item_from_listing(item: Any) -> dict[str, Any] | None:
+        """Build an updatable item from collection-listing data, if complete.
+
+        Collection listings already carry each item's full ``data`` payload,
+        including ``tags`` and ``version``, so no extra ``get_item`` is needed.
+        """
+        raw_data = getattr(item, "raw_data", None)
+        if not isinstance(raw_data, dict):
+            return None
+        if "tags" not in raw_data or "version" not in raw_data:
+            return None
+        return {
+            "key": raw_data.get("key", item.key),
+            "version": raw_data["version"],
+            "data": dict(raw_data),
+        }
+
+    async def _fetch_full_items(self, item_keys: list[str]) -> dict[str, Any]:
+        """Fetch full items; failures are returned as exceptions.
+
+        Uses the multi-key endpoint first and falls back to concurrent
+        single-item fetches if that request fails.
+        """
+        if not item_keys:
+            return {}
+        try:
+            items = await self.data_service.get_items_by_keys(item_keys)
+        except Exception:
+            return await self._fetch_full_items_individually(item_keys)
+
+        by_key = {item.get("key"): item for item in items}
+        return {
+            item_key: by_key.get(item_key)
+            or NotFoundError(f"Item not found: {item_key}")
+            for item_key in item_keys
+        }
+
+    async def _fetch_full_items_individually(
+        self, item_keys: list[str]
+    ) -> dict[str, Any]:
+        """Fetch full items concurrently; failures are returned as exceptions."""
+        semaphore = asyncio.Semaphore(self._REQUEST_CONCURRENCY)
+
+        async def _fetch(item_key: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.data_service.get_item(item_key)
+
+        results = await asyncio.gather(
+            *(_fetch(item_key) for item_key in item_keys), return_exceptions=True
+        )
+        return dict(zip(item_keys, results, strict=True))
+
+    async def _update_full_items(
+        self, full_items: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, str]]:
+        """Write updated items in batches and return per-item failures.
+
+        A batch that fails as a whole is retried item by item so failures
+        can still be attributed to individual keys.
+        """
+        failures: list[dict[str, str]] = []
+        for start in range(0, len(full_items), self._WRITE_BATCH_SIZE):
+            batch = full_items[start : start + self._WRITE_BATCH_SIZE]
+            try:
+                failed = await self.data_service.update_items(
+                    [full_item for _, full_item in batch]
+                )
+            except Exception:
+                failures.extend(await self._update_full_items_individually(batch))
+                continue
+            failures.extend(
+                {"item_key": item_key, "error": failed[item_key]}
+                for item_key, _ in batch
+                if item_key in failed
+            )
+        return failures
+
+    async def _update_full_items_individually(
+        self, full_items: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, str]]:
+        """Write updated items concurrently and return per-item failures."""
+        semaphore = asyncio.Semaphore(self._REQUEST_CONCURRENCY)
+
+        async def _update(full_item: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.data_service.update_item(full_item)
+
+        results = await asyncio.gather(
+            *(_update(full_item) for _, full_item in full_items),
+            return_exceptions=True,
+        )
+        return [
+            {"item_key": item_key, "error": str(result)}
+            for (item_key, _), result in zip(full_items, results, strict=True)
+            if isinstance(result, Exception)
+        ]
+
+    async def _delete_items(self, item_keys: list[str]) -> list[dict[str, str]]:
+        """Delete items in batches and return per-item failures.
+
+        A batch that fails as a whole is retried item by item.
+        """
+        failures: list[dict[str, str]] = []
+        for start in range(0, len(item_keys), self._WRITE_BATCH_SIZE):
+            batch = item_keys[start : start + self._WRITE_BATCH_SIZE]
+            try:
+                await self.data_service.delete_items(batch)
+            except Exception:
+                failures.extend(await self._delete_items_individually(batch))
+        return failures
+
+    async def _delete_items_individually(
+        self, item_keys: list[str]
+    ) -> list[dict[str, str]]:
+        """Delete items concurrently and return per-item failures."""
+        semaphore = asyncio.Semaphore(self._REQUEST_CONCURRENCY)
+
+        async def _delete(item_key: str) -> Any:
+            async with semaphore:
+                return await self.data_service.delete_item(item_key)
+
+        results = await asyncio.gather(
+            *(_delete(item_key) for item_key in item_keys), return_exceptions=True
+        )
+        return [
+            {"key": item_key, "error": str(result)}
+            for item_key, result in zip(item_keys, results, strict=True)
+            if isinstance(result, Exception)
+        ]
+
+    async def _collect_empty_candidates(
+        self,
+        pending: list[tuple[int, Any]],
+        found: list[tuple[int, str, str]],
+        treated_limit: int,
+    ) -> bool:
+        """Check children for a window of items concurrently, in scan order.
+
+        Appends ``(scan position, key, title)`` for each empty item to
+        ``found`` and returns True once ``treated_limit`` is reached.
+        """
+        results = await asyncio.gather(
+            *(self.data_service.get_item_children(item.key) for _, item in pending),
+            return_exceptions=True,
+        )
+        for (position, item), children in zip(pending, results, strict=True):
+            if isinstance(children, Exception) or children:
+                continue
+            found.append((position, item.key, item.title or "(empty)"))
+            if len(found) >= treated_limit:
+                return True
+        return False
+
+    async def _scan_empty_collection(
+        self,
+        col_key: str,
+        scan_limit: int,
+        treated_limit: int,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[tuple[int, str, str]], int]:
+        """Find up to ``treated_limit`` empty items in one collection.
+
+        Returns the matches as ``(scan position, key, title)`` in scan order,
+        and the number of items scanned (up to the last match if the limit
+        was reached).
+        """
+        found: list[tuple[int, str, str]] = []
+        scanned = 0
+        offset = 0
+        skipped_types = self._SKIPPED_CHILD_TYPES
+
+        async with semaphore:
+            while True:
+                items = await self.data_service.get_collection_items(
+                    col_key, limit=scan_limit, start=offset
+                )
+                if not items:
+                    break
+
+                # Children lookups run concurrently in small windows so the
+                # scan still stops as soon as treated_limit is reached.
+                pending: list[tuple[int, Any]] = []
+                for item in items:
+                    scanned += 1
+
+                    if item.item_type in skipped_types:
+                        continue
+
+                    title = (item.title or "").strip()
+                    if title and title != "Untitled":
+                        continue
+
+                    pending.append((scanned, item))
+                    if len(pending) >= self._REQUEST_CONCURRENCY:
+                        if await self._collect_empty_candidates(
+                            pending, found, treated_limit
+                        ):
+                            return found, found[-1][0]
+                        pending = []
+
+                if pending and await self._collect_empty_candidates(
+                    pending, found, treated_limit
+                ):
+                    return found, found[-1][0]
+
+                if len(items) < scan_limit:
+                    break
+                offset += scan_limit
+
+        return found, scanned
 
     async def _resolve_collections(
         self, collection_name: str | None
@@ -33,12 +260,23 @@ class LibraryMaintenanceService:
             return [], f"Collection not found: {collection_name}"
         return matches, None
 
+    def _make_collection_page_fetcher(self, col_key: str) -> Callable[[int, int], Any]:
+        """Build an ``iter_offset_batches`` page fetcher for one collection."""
+
+        async def _fetch_page(offset: int, limit: int) -> list[Any]:
+            return await self.data_service.get_collection_items(
+                col_key, limit=limit, start=offset
+            )
+
+        return _fetch_page
+
     async def clean_empty_items(
         self,
         collection_name: str | None,
         scan_limit: int,
         treated_limit: int,
         dry_run: bool,
+        on_record: RecordCallback | None = None,
     ) -> dict[str, Any]:
         if scan_limit < 1:
             return {"error": "scan_limit must be >= 1"}
@@ -52,68 +290,56 @@ class LibraryMaintenanceService:
         candidates: list[tuple[str, str, str]] = []
         total_scanned = 0
 
-        for col in collections:
-            col_key = col.get("key", "")
-            col_name = col.get("data", {}).get("name", col.get("name", "Unknown"))
-            offset = 0
-
-            while len(candidates) < treated_limit:
-                items = await self.data_service.get_collection_items(
-                    col_key, limit=scan_limit, start=offset
+        # Collections are scanned concurrently but merged in order, so the
+        # result matches a sequential scan; scans past the limit are cancelled.
+        semaphore = asyncio.Semaphore(self._COLLECTION_CONCURRENCY)
+        scans = [
+            asyncio.ensure_future(
+                self._scan_empty_collection(
+                    col.get("key", ""), scan_limit, treated_limit, semaphore
                 )
-                if not items:
+            )
+            for col in collections
+        ]
+        try:
+            for col, scan in zip(collections, scans, strict=True):
+                found, scanned = await scan
+                col_name = col.get("data", {}).get("name", col.get("name", "Unknown"))
+
+                remaining = treated_limit - len(candidates)
+                if len(found) >= remaining:
+                    found = found[:remaining]
+                    scanned = found[-1][0]
+                total_scanned += scanned
+
+                for _position, key, title in found:
+                    candidates.append((key, title, col_name))
+                    if on_record is not None:
+                        on_record({"key": key, "title": title, "collection": col_name})
+
+                if len(candidates) >= treated_limit:
                     break
-
-                for item in items:
-                    total_scanned += 1
-
-                    if item.item_type in self._SKIPPED_CHILD_TYPES:
-                        continue
-
-                    title = item.title or ""
-                    if title.strip() and title.strip() != "Untitled":
-                        continue
-
-                    try:
-                        children = await self.data_service.get_item_children(item.key)
-                    except Exception:
-                        continue
-
-                    if children:
-                        continue
-
-                    candidates.append((item.key, title or "(empty)", col_name))
-                    if len(candidates) >= treated_limit:
-                        break
-
-                if len(items) < scan_limit:
-                    break
-                offset += scan_limit
-
-            if len(candidates) >= treated_limit:
-                break
+        finally:
+            for scan in scans:
+                scan.cancel()
+            await asyncio.gather(*scans, return_exceptions=True)
 
         if dry_run:
-            return {
+            result: dict[str, Any] = {
                 "total_scanned": total_scanned,
                 "empty_items_found": len(candidates),
-                "candidates": [
-                    {"key": key, "title": title, "collection": col_name}
-                    for key, title, col_name in candidates
-                ],
                 "dry_run": True,
             }
+            if on_record is None:
+                result["candidates"] = [
+                    {"key": key, "title": title, "collection": col_name}
+                    for key, title, col_name in candidates
+                ]
+            return result
 
-        deleted = 0
-        failed = 0
-        failures: list[dict[str, str]] = []
-        for key, _, _ in candidates:
-            try:
-                await self.data_service.delete_item(key)
-                deleted += 1
-            except Exception as exc:
-                failed += 1
-                failures.append({"key": key, "error": str(exc)})
+        failures = await self._delete_items([key for key, _, _ in candidates])
+        failed = len(failures)
+        deleted = len(candidates) - failed
 
         return {
             "total_scanned": total_scanned,
@@ -131,9 +357,14 @@ class LibraryMaintenanceService:
         scan_limit: int | None,
         update_limit: int | None,
         dry_run: bool,
+        on_record: RecordCallback | None = None,
     ) -> dict[str, Any]:
-        """Purge specific tags across the library or a named collection."""
-        target_tags = set(normalize_input_tags(tags))
+        """Purge specific tags across the library or a named collection.
+
+        When ``on_record`` is given, each updated item's detail is passed to it
+        as soon as it is decided instead of being collected in ``details``.
+        """
+        target_tags = frozenset(normalize_input_tags(tags))
         if not target_tags:
             return {"error": "At least one non-empty tag is required for purge"}
 
@@ -141,79 +372,92 @@ class LibraryMaintenanceService:
         if error:
             return {"error": error}
 
-        items_updated: list[dict[str, Any]] = []
+        items_updated = 0
+        details: list[dict[str, Any]] = []
         total_scanned = 0
         total_tags_removed = 0
         seen_item_keys: set[str] = set()
         failures: list[dict[str, str]] = []
+        page_size = batch_size if scan_limit is None else min(batch_size, scan_limit)
 
         for col in collections:
-            if update_limit is not None and len(items_updated) >= update_limit:
+            if update_limit is not None and items_updated >= update_limit:
                 break
             if scan_limit is not None and total_scanned >= scan_limit:
                 break
 
             col_key = col.get("key", "")
             col_name = col.get("data", {}).get("name", col.get("name", "Unknown"))
-            offset = 0
-
-            while True:
-                if update_limit is not None and len(items_updated) >= update_limit:
-                    break
-                if scan_limit is not None and total_scanned >= scan_limit:
-                    break
-
-                remaining_scan = (
-                    scan_limit - total_scanned
-                    if scan_limit is not None
-                    else batch_size
-                )
-                current_batch = min(batch_size, remaining_scan)
-                if current_batch <= 0:
-                    break
-
-                items = await self.data_service.get_collection_items(
-                    col_key, limit=current_batch, start=offset
-                )
-                if not items:
-                    break
-
-                for item in items:
-                    if scan_limit is not None and total_scanned >= scan_limit:
+            # Purging tags does not change collection membership, so the next
+            # page can be fetched while the current one is processed.
+            pages = iter_offset_batches(
+                self._make_collection_page_fetcher(col_key),
+                batch_size=page_size,
+                prefetch=True,
+            )
+            async with aclosing(pages):
+                async for _offset, items in pages:
+                    if update_limit is not None and items_updated >= update_limit:
                         break
-                    if update_limit is not None and len(items_updated) >= update_limit:
+                    if scan_limit is not None and total_scanned >= scan_limit:
                         break
 
-                    total_scanned += 1
-                    if item.key in seen_item_keys:
-                        continue
-                    seen_item_keys.add(item.key)
-
-                    try:
-                        full_item = await self.data_service.get_item(item.key)
-                        item_data = full_item.get("data", {})
-                        existing_tags = normalize_tag_names(item_data.get("tags", []))
-                        if not existing_tags:
+                    remaining_scan = (
+                        scan_limit - total_scanned
+                        if scan_limit is not None
+                        else len(items)
+                    )
+
+                    # Reuse listing data where complete; bulk-fetch the rest.
+                    full_items: dict[str, Any] = {}
+                    missing_keys: list[str] = []
+                    for item in items[:remaining_scan]:
+                        if item.key in seen_item_keys or item.key in full_items:
                             continue
-
-                        kept_tags = [
-                            tag_name
-                            for tag_name in existing_tags
-                            if tag_name not in target_tags
-                        ]
-                        removed_tags = [
-                            tag_name
-                            for tag_name in existing_tags
-                            if tag_name in target_tags
-                        ]
-
-                        if not removed_tags:
+                        listed_item = self._full_item_from_listing(item)
+                        if listed_item is None:
+                            missing_keys.append(item.key)
+                        full_items[item.key] = listed_item
+                    full_items.update(await self._fetch_full_items(missing_keys))
+                    pending_writes: list[tuple[str, dict[str, Any]]] = []
+
+                    for item in items:
+                        if scan_limit is not None and total_scanned >= scan_limit:
+                            break
+                        if update_limit is not None and items_updated >= update_limit:
+                            break
+
+                        total_scanned += 1
+                        if item.key in seen_item_keys:
                             continue
-
-                        removed_count = len(removed_tags)
-                        total_tags_removed += removed_count
-                        items_updated.append(
-                            {
+                        seen_item_keys.add(item.key)
+
+                        try:
+                            full_item = full_items[item.key]
+                            if isinstance(full_item, Exception):
+                                raise full_item
+                            item_data = full_item.get("data", {})
+                            existing_tags = normalize_tag_names(
+                                item_data.get("tags", [])
+                            )
+                            if not existing_tags:
+                                continue
+
+                            if target_tags.isdisjoint(existing_tags):
+                                continue
+
+                            kept_tags: list[str] = []
+                            removed_tags: list[str] = []
+                            for tag_name in existing_tags:
+                                if tag_name in target_tags:
+                                    removed_tags.append(tag_name)
+                                else:
+                                    kept_tags.append(tag_name)
+
+                            removed_count = len(removed_tags)
+                            total_tags_removed += removed_count
+                            items_updated += 1
+                            record = {
                                 "item_key": item.key,
                                 "title": item.title or "(no title)",
                                 "collection": col_name,
@@ -221,26 +465,30 @@ class LibraryMaintenanceService:
                                 "removed_tags": sorted(set(removed_tags)),
                                 "kept": len(kept_tags),
                             }
-                        )
-
-                        if not dry_run:
-                            full_item["data"]["tags"] = to_tag_objects(kept_tags)
-                            await self.data_service.update_item(full_item)
-                    except Exception as exc:
-                        failures.append({"item_key": item.key, "error": str(exc)})
-                        continue
+                            if on_record is None:
+                                details.append(record)
+                            else:
+                                on_record(record)
+
+                            if not dry_run:
+                                # Write the bare data dict: it carries key and
+                                # version, and pyzotero rejects partial wrappers.
+                                item_data["tags"] = to_tag_objects(kept_tags)
+                                pending_writes.append((item.key, item_data))
+                        except Exception as exc:
+                            failures.append({"item_key": item.key, "error": str(exc)})
+                            continue
 
-                if len(items) < current_batch:
-                    break
-                offset += current_batch
+                    if pending_writes:
+                        failures.extend(await self._update_full_items(pending_writes))
 
         return {
             "tags": sorted(target_tags),
             "collection": collection_name,
             "total_items_scanned": total_scanned,
-            "items_updated": len(items_updated),
+            "items_updated": items_updated,
             "total_tags_removed": total_tags_removed,
-            "details": items_updated,
+            "details": details,
             "failed": len(failures),
             "failures": failures,
             "dry_run": dry_run,
@@ -5,6 +5,7 @@ This service enhances Zotero items by fetching complete metadata from
 Crossref and OpenAlex APIs and updating items with missing information.
 """
 
+import asyncio
 import html
 import logging
 import re
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 AI_METADATA_TAG = "AI元数据"
 _SKIPPED_ITEM_TYPES = {"attachment", "note", "annotation"}
 _ZOTERO_API_MAX_PAGE_SIZE = 100
+_DEFAULT_CONCURRENCY = 8
 
 # Mapping from enhanced metadata keys to Zotero item data keys
 _METADATA_FIELD_MAP = {
@@ -303,6 +305,7 @@ class MetadataUpdateService:
         treated_limit: int | None = None,
         dry_run: bool = False,
         include_unfiled: bool = True,
+        concurrency: int = _DEFAULT_CONCURRENCY,
     ) -> dict[str, Any]:
         """
         Update metadata for multiple items with batch scanning.
@@ -312,6 +315,7 @@ class MetadataUpdateService:
             scan_limit: Number of items to fetch per batch from API
             treated_limit: Maximum items to process (excludes skipped)
             dry_run: If True, preview changes without applying them
+            concurrency: Maximum items updated at once within a page
 
         Returns:
             Dict with statistics:
@@ -325,6 +329,7 @@ class MetadataUpdateService:
                 scan_limit=scan_limit,
                 treated_limit=treated_limit,
                 dry_run=dry_run,
+                concurrency=concurrency,
             )
         except ValidationError as e:
             logger.error(f"Invalid metadata update parameters: {e}")
@@ -358,6 +363,7 @@ class MetadataUpdateService:
         total_processed = 0
         total_scanned = 0
         seen_item_keys: set[str] = set()
+        semaphore = asyncio.Semaphore(params.concurrency)
 
         if params.collection_key:
             collection_keys = [params.collection_key]
@@ -383,6 +389,7 @@ class MetadataUpdateService:
                 total_processed=total_processed,
                 dry_run=params.dry_run,
                 seen_item_keys=seen_item_keys,
+                semaphore=semaphore,
             )
             total_scanned += scanned
             total_processed += proc
@@ -409,6 +416,7 @@ class MetadataUpdateService:
                 total_processed=total_processed,
                 dry_run=params.dry_run,
                 seen_item_keys=seen_item_keys,
+                semaphore=semaphore,
             )
             total_scanned += scanned
             total_processed += proc
@@ -460,6 +468,7 @@ class MetadataUpdateService:
         total_processed: int,
         dry_run: bool,
         seen_item_keys: set[str],
+        semaphore: asyncio.Semaphore,
     ) -> tuple[int, int, int, int, int, int]:
         """
         Process a single collection for metadata updates.
@@ -496,6 +505,7 @@ class MetadataUpdateService:
             ]
             scanned += len(parent_items)
 
+            pending_keys: list[str] = []
             for item in parent_items:
                 if (
                     treated_limit is not None
@@ -515,15 +525,14 @@ class MetadataUpdateService:
                     continue
 
                 processed += 1
-                result = await self.update_item_metadata(item.key, dry_run=dry_run)
+                pending_keys.append(item.key)
 
-                if result["success"]:
-                    if result["updated"]:
-                        updated += 1
-                    else:
-                        skipped += 1
-                else:
-                    failed += 1
+            upd, skip, fail = await self._update_items_concurrently(
+                pending_keys, dry_run=dry_run, semaphore=semaphore
+            )
+            updated += upd
+            skipped += skip
+            failed += fail
 
         return (
             scanned,
@@ -541,6 +550,7 @@ class MetadataUpdateService:
         total_processed: int,
         dry_run: bool,
         seen_item_keys: set[str],
+        semaphore: asyncio.Semaphore,
     ) -> tuple[int, int, int, int, int, int]:
         """Process full-library items to include unfiled/root entries."""
         scanned = 0
@@ -565,6 +575,7 @@ class MetadataUpdateService:
             ]
             scanned += len(parent_items)
 
+            pending_keys: list[str] = []
             for item in parent_items:
                 if (
                     treated_limit is not None
@@ -583,17 +594,48 @@ class MetadataUpdateService:
                     continue
 
                 processed += 1
-                result = await self.update_item_metadata(item.key, dry_run=dry_run)
-                if result["success"]:
-                    if result["updated"]:
-                        updated += 1
-                    else:
-                        skipped += 1
-                else:
-                    failed += 1
+                pending_keys.append(item.key)
+
+            upd, skip, fail = await self._update_items_concurrently(
+                pending_keys, dry_run=dry_run, semaphore=semaphore
+            )
+            updated += upd
+            skipped += skip
+            failed += fail
 
         return scanned, processed, updated, skipped, failed, ai_metadata_tagged
 
+    async def _update_items_concurrently(
+        self,
+        item_keys: list[str],
+        dry_run: bool,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[int, int, int]:
+        """
+        Update metadata for one page of items, bounded by ``semaphore``.
+
+        Returns:
+            Tuple of (updated, skipped, failed)
+        """
+
+        async def _update(item_key: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.update_item_metadata(item_key, dry_run=dry_run)
+
+        results = await asyncio.gather(
+            *(_update(key) for key in item_keys), return_exceptions=True
+        )
+
+        updated = skipped = failed = 0
+        for result in results:
+            if isinstance(result, BaseException) or not result["success"]:
+                failed += 1
+            elif result["updated"]:
+                updated += 1
+            else:
+                skipped += 1
+        return updated, skipped, failed
+
     def _make_collection_batch_fetcher(
         self, coll_key: str
     ):
@@ -12,7 +12,7 @@ from typing import Any, Literal
 
 from zotero_mcp.services.common.pagination import iter_offset_batches
 from zotero_mcp.services.common.retry import async_retry_with_backoff
-from zotero_mcp.services.data_access import DataAccessService
+from zotero_mcp.services.data_access import DataAccessService, get_data_service
 from zotero_mcp.utils.config.logging import get_logger
 from zotero_mcp.utils.formatting.helpers import normalize_item_key
 
@@ -36,7 +36,7 @@ class NoteRelationService:
     """Analyze one note against other notes and write Zotero related metadata."""
 
     def __init__(self, data_service: DataAccessService | None = None):
-        self.data_service = data_service or DataAccessService()
+        self.data_service = data_service or get_data_service()
         self._deepseek_client: Any | None = None
         self._deepseek_model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
 
@@ -16,10 +16,41 @@ from zotero_mcp.services.zotero.result_mapper import (
     api_item_to_search_result,
     zotero_item_to_search_result,
 )
+from zotero_mcp.utils.async_helpers.cache import ResponseCache
 from zotero_mcp.utils.formatting.tags import normalize_input_tags, normalize_tag_names
 
 logger = logging.getLogger(__name__)
 
+# Short TTL: repeated identical searches (agent loops) reuse results, while
+# writes made outside this process become visible within a minute.
+SEARCH_CACHE_TTL_SECONDS = 60
+# Bounds memory for long-running servers that see many distinct queries.
+SEARCH_CACHE_MAXSIZE = 256
+
+
+def _server_tag_filter(include_tags: list[str], exclude: set[str]) -> str | list[str]:
+    """
+    Build the Zotero ``tag`` query for a tag search.
+
+    Repeated ``tag`` values are ANDed by the API and a leading "-" negates
+    one. Tags that the API would misread (a leading "-" or an "||" OR
+    operator) are left to the client-side filter.
+    """
+
+    def _is_plain(tag: str) -> bool:
+        return not tag.startswith("-") and "||" not in tag
+
+    filters = [tag for tag in include_tags if _is_plain(tag)]
+    filters.extend(f"-{tag}" for tag in sorted(exclude) if _is_plain(tag))
+    if not filters:
+        return include_tags[0]
+    return filters[0] if len(filters) == 1 else filters
+
+
+def _copy_results(results: list[SearchResultItem]) -> list[SearchResultItem]:
+    """Copy cached results so callers cannot mutate the cached models."""
+    return [item.model_copy(deep=True) for item in results]
+
 
 class SearchService:
     """
@@ -40,6 +71,13 @@ class SearchService:
         """
         self.api_client = api_client
         self.local_client = local_client
+        self._cache = ResponseCache(
+            ttl_seconds=SEARCH_CACHE_TTL_SECONDS, maxsize=SEARCH_CACHE_MAXSIZE
+        )
+
+    def clear_cache(self) -> None:
+        """Drop cached search results (call after library writes)."""
+        self._cache.clear()
 
     async def search_items(
         self,
@@ -62,16 +100,34 @@ class SearchService:
         Returns:
             List of search results
         """
+        cache_params = {
+            "query": query,
+            "limit": limit,
+            "offset": offset,
+            "qmode": qmode,
+        }
+        cached = self._cache.get("search_items", cache_params)
+        if cached is not None:
+            return _copy_results(cached)
+
+        results = await self._search_items_uncached(query, limit, offset, qmode)
+        self._cache.set("search_items", cache_params, results)
+        return _copy_results(results)
+
+    async def _search_items_uncached(
+        self,
+        query: str,
+        limit: int,
+        offset: int,
+        qmode: Literal["titleCreatorYear", "everything"],
+    ) -> list[SearchResultItem]:
         # Try local database first for speed
         if self.local_client and qmode == "everything":
             try:
-                items = self.local_client.search_items(query, limit=limit + offset)
-                if offset >= len(items):
-                    return []
-                return [
-                    zotero_item_to_search_result(item)
-                    for item in items[offset : offset + limit]
-                ]
+                items = self.local_client.search_items(
+                    query, limit=limit, offset=offset
+                )
+                return [zotero_item_to_search_result(item) for item in items]
             except Exception as e:
                 logger.warning(f"Local search failed, falling back to API: {e}")
 
@@ -130,14 +186,36 @@ class SearchService:
         if not include_tags:
             return []
 
+        cache_params = {
+            "tags": include_tags,
+            "exclude_tags": sorted(exclude),
+            "limit": limit,
+        }
+        cached = self._cache.get("search_by_tag", cache_params)
+        if cached is not None:
+            return _copy_results(cached)
+
+        results = await self._search_by_tag_uncached(include_tags, exclude, limit)
+        self._cache.set("search_by_tag", cache_params, results)
+        return _copy_results(results)
+
+    async def _search_by_tag_uncached(
+        self,
+        include_tags: list[str],
+        exclude: set[str],
+        limit: int,
+    ) -> list[SearchResultItem]:
+
         filtered: list[dict] = []
         seen_keys: set[str] = set()
         api_limit = max(100, limit)
         offset = 0
+        tag_filter = _server_tag_filter(include_tags, exclude)
+        required = frozenset(include_tags)
 
         while len(filtered) < limit:
             items = await self.api_client.get_items_by_tag(
-                include_tags[0],
+                tag_filter,
                 limit=api_limit,
                 start=offset,
             )
@@ -155,12 +233,14 @@ class SearchService:
                 if item_key:
                     seen_keys.add(item_key)
                     new_items += 1
+                # The API applies the tag filter already; re-check locally for
+                # tags it could not express and for endpoints that ignore it.
                 item_tags = set(
                     normalize_tag_names(item.get("data", {}).get("tags", []))
                 )
-                if any(tag not in item_tags for tag in include_tags):
+                if not required.issubset(item_tags):
                     continue
-                if exclude and any(tag in item_tags for tag in exclude):
+                if exclude and not exclude.isdisjoint(item_tags):
                     continue
                 filtered.append(item)
                 if len(filtered) >= limit:
@@ -21,6 +21,7 @@ class ZoteroSettings(BaseSettings):
         env_file_encoding="utf-8",
         env_prefix="ZOTERO_",
         extra="ignore",
+        frozen=True,
     )
 
     # Server metadata
@@ -2,29 +2,69 @@
 Utility functions and helpers for Zotero MCP.
 """
 
-from .config import get_logger, log_task_end, log_task_start
-from .data import (
-    RESEARCH_ANALYSIS_TEMPLATE_JSON,
-    get_analysis_questions,
-)
-from .formatting import (
-    DOI_PATTERN,
-    beautify_ai_note,
-    clean_html,
-    clean_title,
-    format_creators,
-    is_local_mode,
-    markdown_to_html,
-)
-from .system import (
-    AuthenticationError,
-    ConfigurationError,
-    ConnectionError,
-    DatabaseError,
-    NotFoundError,
-    ValidationError,
-    ZoteroMCPError,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .config import get_logger, log_task_end, log_task_start
+    from .data import (
+        RESEARCH_ANALYSIS_TEMPLATE_JSON,
+        get_analysis_questions,
+    )
+    from .formatting import (
+        DOI_PATTERN,
+        beautify_ai_note,
+        clean_html,
+        clean_title,
+        format_creators,
+        is_local_mode,
+        markdown_to_html,
+    )
+    from .system import (
+        AuthenticationError,
+        ConfigurationError,
+        ConnectionError,
+        DatabaseError,
+        NotFoundError,
+        ValidationError,
+        ZoteroMCPError,
+    )
+
+# Re-exported name -> defining subpackage. Resolved on first access so that
+# importing one utility module (e.g. ``utils.formatting.tags``) does not load
+# the templates, logging and markdown helpers as well.
+_LAZY_EXPORTS: dict[str, str] = {
+    # System
+    "ZoteroMCPError": ".system",
+    "ConnectionError": ".system",
+    "AuthenticationError": ".system",
+    "NotFoundError": ".system",
+    "ValidationError": ".system",
+    "DatabaseError": ".system",
+    "ConfigurationError": ".system",
+    # Config
+    "get_logger": ".config",
+    "log_task_start": ".config",
+    "log_task_end": ".config",
+    # Data
+    "get_analysis_questions": ".data",
+    "RESEARCH_ANALYSIS_TEMPLATE_JSON": ".data",
+    # Formatting
+    "beautify_ai_note": ".formatting",
+    "markdown_to_html": ".formatting",
+    "format_creators": ".formatting",
+    "clean_title": ".formatting",
+    "clean_html": ".formatting",
+    "is_local_mode": ".formatting",
+    "DOI_PATTERN": ".formatting",
+}
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     # System
@@ -0,0 +1,32 @@
+"""Lazy re-exports for package ``__init__`` modules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import importlib
+import sys
+from typing import Any
+
+
+def lazy_getattr(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module ``__getattr__`` that imports re-exports on first access.
+
+    Args:
+        package: ``__name__`` of the package doing the re-exporting
+        exports: Re-exported name -> defining module, relative to ``package``
+
+    Returns:
+        A function to assign to the package's ``__getattr__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -2,6 +2,7 @@
 Response caching layer.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import hashlib
 import json
@@ -11,15 +12,18 @@ from typing import Any
 class ResponseCache:
     """Simple in-memory cache for tool responses."""
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: int = 300, maxsize: int | None = None):
         """
         Initialize cache.
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default: 5 minutes)
+            maxsize: Maximum number of entries; the least recently used
+                entry is evicted beyond it (default: unbounded)
         """
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+        self._cache: OrderedDict[str, tuple[Any, datetime]] = OrderedDict()
         self._ttl = timedelta(seconds=ttl_seconds)
+        self._maxsize = maxsize
 
     def _make_key(self, tool_name: str, params: dict) -> str:
         """Generate cache key from tool name and parameters."""
@@ -37,6 +41,7 @@ class ResponseCache:
 
             # Check if expired
             if datetime.now() - timestamp < self._ttl:
+                self._cache.move_to_end(key)
                 return response
             else:
                 # Remove expired entry
@@ -47,7 +52,20 @@ class ResponseCache:
     def set(self, tool_name: str, params: dict, response: Any) -> None:
         """Cache a response."""
         key = self._make_key(tool_name, params)
-        self._cache[key] = (response, datetime.now())
+        now = datetime.now()
+        self._cache[key] = (response, now)
+        self._cache.move_to_end(key)
+        if self._maxsize is None:
+            return
+
+        # Entries are kept in recency order, so expired ones are not
+        # necessarily at the front; drop them all before evicting by age.
+        if len(self._cache) > self._maxsize:
+            expired = [k for k, (_, ts) in self._cache.items() if now - ts >= self._ttl]
+            for expired_key in expired:
+                del self._cache[expired_key]
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
 
     def clear(self) -> None:
         """Clear all cached entries."""
@@ -1,16 +1,45 @@
 """Configuration and logging setup."""
 
-from .config import (
-    _clear_cache,
-    get_config_path,
-    get_relevant_env_prefixes,
-    load_config,
-)
-from .logging import get_logger, log_task_end, log_task_start
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zotero_mcp.utils._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .config import (
+        _clear_cache,
+        clear_json_file_cache,
+        get_config_path,
+        get_relevant_env_prefixes,
+        load_config,
+        load_json_file,
+    )
+    from .logging import get_logger, log_task_end, log_task_start
+
+# Re-exported name -> defining module, resolved on first access so that
+# reading config does not set up logging and vice versa.
+_LAZY_EXPORTS: dict[str, str] = {
+    "_clear_cache": ".config",
+    "clear_json_file_cache": ".config",
+    "load_config": ".config",
+    "load_json_file": ".config",
+    "get_config_path": ".config",
+    "get_relevant_env_prefixes": ".config",
+    "get_logger": ".logging",
+    "log_task_end": ".logging",
+    "log_task_start": ".logging",
+}
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "_clear_cache",
+    "clear_json_file_cache",
     "load_config",
+    "load_json_file",
     "get_config_path",
     "get_relevant_env_prefixes",
     "get_logger",
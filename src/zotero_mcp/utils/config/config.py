@@ -12,6 +12,8 @@ Features:
 - Centralized configuration management
 """
 
+import copy
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
@@ -19,6 +21,11 @@ from typing import Any
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # -------------------- Configuration Cache --------------------
 
 
@@ -42,6 +49,38 @@ def _is_cache_valid() -> bool:
     return _config_cache is not None and (time.time() - _cache_timestamp) < _CACHE_TTL
 
 
+@lru_cache(maxsize=8)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; cached per (path, mtime, size) so edits invalidate."""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Fall back to json for its error message and leniency
+    return json.loads(raw)
+
+
+def load_json_file(path: str | Path) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    Returns a deep copy so callers may mutate the result freely.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    stat = os.stat(path)
+    parsed = _parse_json_file(str(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(parsed)
+
+
+def clear_json_file_cache() -> None:
+    """Forget parsed JSON files; call after rewriting a file in place."""
+    _parse_json_file.cache_clear()
+
+
 # -------------------- Environment Modes --------------------
 
 
@@ -171,8 +210,7 @@ def load_opencode_config() -> dict[str, Any]:
         return {}
 
     try:
-        with open(config_path) as f:
-            config = json.load(f)
+        config = load_json_file(config_path)
 
         # Opencode may store MCP servers in different formats
         # Try common patterns
@@ -197,8 +235,7 @@ def load_standalone_config() -> dict[str, Any]:
         return {}
 
     try:
-        with open(config_path) as f:
-            return json.load(f)
+        return load_json_file(config_path)
     except (json.JSONDecodeError, OSError):
         return {}
 
@@ -402,6 +439,7 @@ def save_config(config: dict[str, Any]) -> bool:
     try:
         with open(config_path, "w") as f:
             json.dump(config, f, indent=2)
+        clear_json_file_cache()
         return True
     except OSError:
         return False
@@ -1,13 +1,34 @@
 """Data processing and mapping utilities."""
 
-from .templates import (
-    RESEARCH_ANALYSIS_TEMPLATE_JSON,
-    RESEARCH_ANALYSIS_TEMPLATE_MD,
-    REVIEW_ANALYSIS_TEMPLATE_JSON,
-    get_analysis_questions,
-    get_review_analysis_template,
-    resolve_analysis_template,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zotero_mcp.utils._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .templates import (
+        RESEARCH_ANALYSIS_TEMPLATE_JSON,
+        RESEARCH_ANALYSIS_TEMPLATE_MD,
+        REVIEW_ANALYSIS_TEMPLATE_JSON,
+        get_analysis_questions,
+        get_review_analysis_template,
+        resolve_analysis_template,
+    )
+
+# Re-exported name -> defining module, resolved on first access.
+_LAZY_EXPORTS: dict[str, str] = {
+    "RESEARCH_ANALYSIS_TEMPLATE_JSON": ".templates",
+    "RESEARCH_ANALYSIS_TEMPLATE_MD": ".templates",
+    "REVIEW_ANALYSIS_TEMPLATE_JSON": ".templates",
+    "get_analysis_questions": ".templates",
+    "resolve_analysis_template": ".templates",
+    "get_review_analysis_template": ".templates",
+}
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "RESEARCH_ANALYSIS_TEMPLATE_JSON",
@@ -995,6 +995,10 @@ THEME_PRESETS = {
 
 # -------------------- Configuration Loading --------------------
 
+# (loaded config, derived analysis config). load_config() returns the same
+# dict until its TTL cache expires, so the parsed result is reused until then.
+_analysis_config_cache: tuple[dict[str, Any], dict[str, Any]] | None = None
+
 
 def get_analysis_config() -> dict[str, Any]:
     """
@@ -1007,7 +1011,19 @@ def get_analysis_config() -> dict[str, Any]:
         - theme: Note theme preset name
         - theme_config: Custom theme configuration (if provided)
     """
+    global _analysis_config_cache
+
     config = load_config()
+    cached = _analysis_config_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    analysis = _build_analysis_config(config)
+    _analysis_config_cache = (config, analysis)
+    return analysis
+
+
+def _build_analysis_config(config: dict[str, Any]) -> dict[str, Any]:
     env = config.get("env", {})
     analysis_config = config.get("analysis", {})
 
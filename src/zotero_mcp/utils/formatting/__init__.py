@@ -1,15 +1,39 @@
 """Text and formatting utilities."""
 
-from .beautify import beautify_ai_note
-from .helpers import (
-    DOI_PATTERN,
-    clean_html,
-    clean_title,
-    format_creators,
-    is_local_mode,
-    normalize_item_key,
-)
-from .markdown import markdown_to_html
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zotero_mcp.utils._lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .beautify import beautify_ai_note
+    from .helpers import (
+        DOI_PATTERN,
+        clean_html,
+        clean_title,
+        format_creators,
+        is_local_mode,
+        normalize_item_key,
+    )
+    from .markdown import markdown_to_html
+
+# Re-exported name -> defining module, resolved on first access so that the
+# light helpers do not pull in beautify's template and config loading.
+_LAZY_EXPORTS: dict[str, str] = {
+    "beautify_ai_note": ".beautify",
+    "markdown_to_html": ".markdown",
+    "DOI_PATTERN": ".helpers",
+    "clean_html": ".helpers",
+    "clean_title": ".helpers",
+    "format_creators": ".helpers",
+    "is_local_mode": ".helpers",
+    "normalize_item_key": ".helpers",
+}
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "beautify_ai_note",
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 
+def _dict_tag_name(raw_tag: dict) -> str:
+    return str(raw_tag.get("tag", "")).strip()
+
+
+# Exact-type dispatch for the common payload shapes; subclasses fall back to
+# the isinstance checks in extract_tag_name.
+_TAG_NAME_EXTRACTORS: dict[type, Callable[[Any], str]] = {
+    dict: _dict_tag_name,
+    str: str.strip,
+}
+
+
 def extract_tag_name(raw_tag: Any) -> str:
     """Extract a normalized tag name from Zotero tag payload values."""
+    extractor = _TAG_NAME_EXTRACTORS.get(type(raw_tag))
+    if extractor is not None:
+        return extractor(raw_tag)
     if isinstance(raw_tag, dict):
-        return str(raw_tag.get("tag", "")).strip()
+        return _dict_tag_name(raw_tag)
     if isinstance(raw_tag, str):
         return raw_tag.strip()
     return ""
@@ -19,12 +35,8 @@ def normalize_tag_names(raw_tags: Any) -> list[str]:
     if not isinstance(raw_tags, list):
         return []
 
-    normalized: list[str] = []
-    for raw_tag in raw_tags:
-        tag_name = extract_tag_name(raw_tag)
-        if tag_name:
-            normalized.append(tag_name)
-    return normalized
+    extract = extract_tag_name
+    return [tag_name for raw_tag in raw_tags if (tag_name := extract(raw_tag))]
 
 
 def normalize_input_tags(tags: list[str] | None) -> list[str]:
@@ -0,0 +1,100 @@
+"""Tests for ZoteroAPIClient batched operations."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from zotero_mcp.clients.zotero.api_client import ZoteroAPIClient
+
+
+def _write_client(responses):
+    client = ZoteroAPIClient(library_id="1", local=True)
+    client._client = MagicMock()
+    client._client.endpoint = "https://api.zotero.org"
+    client._client.library_type = "users"
+    client._client.library_id = "1"
+    client._client.check_items.side_effect = lambda items: items
+    client._client.client.request.side_effect = responses
+    return client
+
+
+def _response(body=None, headers=None):
+    response = MagicMock()
+    response.json.return_value = body
+    response.headers = headers or {}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_update_items_batches_by_50_and_maps_failed_indices():
+    client = _write_client(
+        [
+            _response(
+                {"successful": {}, "failed": {"1": {"code": 412, "message": "no"}}}
+            ),
+            _response({"successful": {}, "failed": {}}),
+        ]
+    )
+
+    items = [{"key": f"K{i}", "version": 1, "tags": []} for i in range(60)]
+    failed = await client.update_items(items)
+
+    calls = client._client.client.request.call_args_list
+    assert [call.args[0] for call in calls] == ["POST", "POST"]
+    assert calls[0].args[1] == "https://api.zotero.org/users/1/items"
+    assert [len(call.kwargs["json"]) for call in calls] == [50, 10]
+    assert failed == {"K1": "no"}
+    client._client.update_items.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_items_ignores_non_dict_response_body():
+    client = _write_client([_response([{"key": "other"}])])
+
+    failed = await client.update_items([{"key": "K0", "version": 1, "tags": []}])
+
+    assert failed == {}
+
+
+@pytest.mark.asyncio
+async def test_delete_items_batches_by_50_with_library_version():
+    client = _write_client(
+        [
+            _response(headers={"last-modified-version": "11"}),
+            _response(headers={"last-modified-version": "12"}),
+        ]
+    )
+    client._client.last_modified_version.return_value = 10
+
+    await client.delete_items([f"K{i}" for i in range(51)])
+
+    calls = client._client.client.request.call_args_list
+    assert [call.args[0] for call in calls] == ["DELETE", "DELETE"]
+    assert [len(call.kwargs["params"]["itemKey"].split(",")) for call in calls] == [
+        50,
+        1,
+    ]
+    assert calls[1].kwargs["params"]["itemKey"] == "K50"
+    assert [
+        call.kwargs["headers"]["If-Unmodified-Since-Version"] for call in calls
+    ] == [
+        "10",
+        "11",
+    ]
+    client._client.last_modified_version.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_items_by_keys_batches_item_key_filter_by_50():
+    client = ZoteroAPIClient(library_id="1", local=True)
+    client._client = MagicMock()
+    client._client.items.side_effect = lambda **kwargs: [
+        {"key": key} for key in kwargs["itemKey"].split(",")
+    ]
+
+    items = await client.get_items_by_keys([f"K{i}" for i in range(55)])
+
+    calls = client._client.items.call_args_list
+    assert [call.kwargs["limit"] for call in calls] == [50, 5]
+    assert calls[1].kwargs["itemKey"] == "K50,K51,K52,K53,K54"
+    assert len(items) == 55
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from zotero_mcp.services.common.pagination import iter_offset_batches
@@ -21,3 +23,51 @@ async def test_iter_offset_batches_stops_on_short_page():
 
     assert pages == [(0, [1, 2, 3]), (3, [4])]
     assert calls == [(0, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_iter_offset_batches_prefetches_next_page_before_yielding():
+    calls = []
+
+    async def fetch_page(offset: int, limit: int):
+        calls.append((offset, limit))
+        return {0: [1, 2], 2: [3, 4], 4: [5]}.get(offset, [])
+
+    pages = []
+    async for offset, page in iter_offset_batches(
+        fetch_page, batch_size=2, prefetch=True
+    ):
+        await asyncio.sleep(0)
+        pages.append((offset, page, list(calls)))
+
+    assert pages == [
+        (0, [1, 2], [(0, 2), (2, 2)]),
+        (2, [3, 4], [(0, 2), (2, 2), (4, 2)]),
+        (4, [5], [(0, 2), (2, 2), (4, 2)]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_offset_batches_cancels_unused_prefetch_on_early_exit():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fetch_page(offset: int, limit: int):
+        if offset == 0:
+            return [1, 2]
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    batches = iter_offset_batches(fetch_page, batch_size=2, prefetch=True)
+    async for _offset, _page in batches:
+        await started.wait()
+        break
+    await batches.aclose()
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
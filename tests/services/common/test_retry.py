@@ -0,0 +1,66 @@
+import pytest
+
+from zotero_mcp.services.common import retry as retry_module
+from zotero_mcp.services.common.retry import async_retry_with_backoff
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", _fake_sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_retry_jitters_within_backoff_and_skips_final_sleep(sleeps):
+    calls = 0
+
+    async def _flaky():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await async_retry_with_backoff(_flaky, retries=3, base_delay=1.0)
+
+    assert calls == 4
+    caps = (1.0, 2.0, 4.0)
+    assert all(0 <= delay <= cap for delay, cap in zip(sleeps, caps, strict=True))
+
+
+@pytest.mark.asyncio
+async def test_retry_without_jitter_uses_exact_backoff(sleeps):
+    attempts = iter([RuntimeError("a"), RuntimeError("b"), "ok"])
+
+    async def _flaky():
+        result = next(attempts)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    result = await async_retry_with_backoff(
+        _flaky, base_delay=1.0, max_delay=1.5, jitter=False
+    )
+
+    assert result == "ok"
+    assert sleeps == [1.0, 1.5]
+
+
+@pytest.mark.asyncio
+async def test_retry_propagates_exceptions_outside_retry_on(sleeps):
+    calls = 0
+
+    async def _fails():
+        nonlocal calls
+        calls += 1
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        await async_retry_with_backoff(_fails, retry_on=(OSError,))
+
+    assert calls == 1
+    assert sleeps == []
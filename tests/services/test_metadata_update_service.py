@@ -1,5 +1,6 @@
 """Tests for MetadataUpdateService."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -285,6 +286,40 @@ async def test_update_all_items_collection_pagination_not_stopped_by_parent_filt
     assert update_item_metadata_mock.await_count == 2
 
 
+@pytest.mark.asyncio
+async def test_update_all_items_updates_page_concurrently_within_bound():
+    item_service = AsyncMock()
+    service = MetadataUpdateService(item_service, AsyncMock())
+    item_service.get_sorted_collections.return_value = [{"key": "COLL1"}]
+    item_service.api_client.get_collection_items.side_effect = [
+        [_api_item(f"P{i}") for i in range(5)],
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def _update(item_key: str, dry_run: bool = False) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if item_key == "P3":
+            raise RuntimeError("boom")
+        return {"success": True, "updated": item_key != "P0"}
+
+    with patch.object(service, "update_item_metadata", side_effect=_update):
+        result = await service.update_all_items(
+            scan_limit=100,
+            dry_run=True,
+            include_unfiled=False,
+            concurrency=2,
+        )
+
+    assert peak == 2
+    assert result["processed_candidates"] == 5
+    assert (result["updated"], result["skipped"], result["failed"]) == (3, 1, 1)
+
+
 def test_build_updated_item_data_skips_periodical_fields_for_book():
     """Book items should not be assigned journal-only fields."""
     item_service = AsyncMock()
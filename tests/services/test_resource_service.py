@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from zotero_mcp.models.common import SearchResultItem
 from zotero_mcp.services.resource_service import ResourceService
 
 
@@ -18,6 +19,58 @@ async def test_create_items_wraps_single_payload():
     data_service.create_items.assert_awaited_once_with([payload])
 
 
+@pytest.mark.asyncio
+async def test_create_items_batches_large_payloads_and_merges_results():
+    data_service = MagicMock()
+    data_service.create_items = AsyncMock(
+        side_effect=lambda batch: {
+            "successful": {str(i): {"key": f"K{i}"} for i in range(len(batch))},
+            "failed": {},
+            "created": len(batch),
+        }
+    )
+    service = ResourceService(data_service=data_service)
+
+    payload = [{"data": {"title": f"Item {i}"}} for i in range(120)]
+    result = await service.create_items(payload)
+
+    batch_sizes = [
+        len(call.args[0]) for call in data_service.create_items.await_args_list
+    ]
+    assert batch_sizes == [50, 50, 20]
+    assert result["created"] == 120
+    assert len(result["successful"]) == 120
+    assert "119" in result["successful"]
+
+
+@pytest.mark.asyncio
+async def test_create_items_maps_indices_past_skipped_duplicates(monkeypatch):
+    from zotero_mcp.services.zotero.item_service import ItemService
+
+    monkeypatch.delenv("ZOTERO_PRECREATE_DEDUP", raising=False)
+    api_client = AsyncMock()
+    api_client.search_items.return_value = []
+    api_client.create_items.side_effect = lambda batch: {
+        "successful": {str(i): {"key": item["title"]} for i, item in enumerate(batch)},
+        "failed": {},
+    }
+    data_service = MagicMock()
+    data_service.create_items = ItemService(api_client=api_client).create_items
+    service = ResourceService(data_service=data_service)
+
+    payload = [{"title": f"Item {i}", "DOI": f"10.1/{i}"} for i in range(60)]
+    # Items 1 and 2 repeat item 0's DOI and are skipped in the first batch.
+    payload[1]["DOI"] = payload[2]["DOI"] = payload[0]["DOI"]
+    result = await service.create_items(payload)
+
+    assert result["skipped_duplicates"] == 2
+    assert result["created"] == 58
+    assert "1" not in result["successful"]
+    assert all(
+        entry["key"] == f"Item {index}" for index, entry in result["successful"].items()
+    )
+
+
 @pytest.mark.asyncio
 async def test_search_notes_filters_and_paginates():
     data_service = MagicMock()
@@ -51,6 +104,31 @@ async def test_search_notes_filters_and_paginates():
     assert result["results"][0]["note_key"] == "N3"
 
 
+@pytest.mark.asyncio
+async def test_search_notes_keeps_candidate_order_with_concurrent_fetches():
+    import asyncio
+
+    data_service = MagicMock()
+    data_service.search_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(key="SLOW", title="Slow Item"),
+            SimpleNamespace(key="FAST", title="Fast Item"),
+        ]
+    )
+
+    async def _get_notes(item_key: str):
+        if item_key == "SLOW":
+            await asyncio.sleep(0.01)
+        return [{"data": {"key": f"N-{item_key}", "note": "matched"}}]
+
+    data_service.get_notes = AsyncMock(side_effect=_get_notes)
+    service = ResourceService(data_service=data_service)
+
+    result = await service.search_notes(query="matched", limit=10, offset=0)
+
+    assert [hit["note_key"] for hit in result["results"]] == ["N-SLOW", "N-FAST"]
+
+
 @pytest.mark.asyncio
 async def test_list_annotations_filters_by_type():
     data_service = MagicMock()
@@ -256,3 +334,24 @@ async def test_delete_empty_collections_deletes_only_empty_ones():
     assert result["empty_collections_found"] == 1
     assert result["deleted"] == 1
     data_service.delete_collection.assert_awaited_once_with("C1")
+
+
+@pytest.mark.asyncio
+async def test_list_items_dumps_results_like_model_dump():
+    results = [
+        SearchResultItem(
+            key="I1",
+            title="Item 1",
+            item_type="journalArticle",
+            raw_data={"tags": [{"tag": "keep"}]},
+        ),
+        SearchResultItem(key="I2", title="Item 2", item_type="book", year=2020),
+    ]
+    data_service = MagicMock()
+    data_service.get_all_items = AsyncMock(return_value=results)
+    data_service.get_collection_items = AsyncMock(return_value=results)
+    service = ResourceService(data_service=data_service)
+
+    expected = {"count": 2, "items": [item.model_dump() for item in results]}
+    assert await service.list_items(limit=10, offset=0) == expected
+    assert await service.list_collection_items("C1", limit=10, offset=0) == expected
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -216,6 +217,31 @@ async def test_find_duplicate_groups_does_not_merge_same_title_with_different_do
     assert result["groups"] == []
 
 
+@pytest.mark.asyncio
+async def test_find_duplicate_groups_normalizes_each_doi_once(monkeypatch):
+    from zotero_mcp.services.zotero import duplicate_service as module
+
+    calls: list[str | None] = []
+    original = module._normalize_doi
+
+    def _counting_normalize(raw_doi):
+        calls.append(raw_doi)
+        return original(raw_doi)
+
+    monkeypatch.setattr(module, "_normalize_doi", _counting_normalize)
+    service = DuplicateDetectionService(item_service=AsyncMock())
+    items = [
+        _api_item("T1", doi="10.1000/one", title="Same Title"),
+        _api_item("T2", doi="10.1000/two", title="Same Title"),
+        _api_item("T3", title="Same Title"),
+    ]
+
+    result = await service._find_duplicate_groups(items)
+
+    assert result["groups"] == []
+    assert len(calls) == len(items)
+
+
 @pytest.mark.asyncio
 async def test_find_duplicate_groups_does_not_merge_same_url_with_different_titles():
     service = DuplicateDetectionService(item_service=AsyncMock())
@@ -244,7 +270,7 @@ async def test_find_and_remove_duplicates_counts_delete_failures():
     item_service.api_client.get_item = AsyncMock(
         return_value=_api_item("D2", doi="10.1000/dup", title="Paper D copy")
     )
-    item_service.api_client.delete_item = AsyncMock(side_effect=RuntimeError("boom"))
+    item_service.delete_item = AsyncMock(side_effect=RuntimeError("boom"))
 
     service = DuplicateDetectionService(item_service=item_service)
     result = await service.find_and_remove_duplicates(
@@ -260,6 +286,52 @@ async def test_find_and_remove_duplicates_counts_delete_failures():
     assert result["delete_failures"] == 1
 
 
+@pytest.mark.asyncio
+async def test_remove_duplicates_deletes_concurrently_and_preserves_notes(
+    monkeypatch,
+):
+    from zotero_mcp.services.zotero.duplicate_service import DuplicateGroup
+
+    item_service = AsyncMock()
+    in_flight = 0
+    peak = 0
+
+    async def _get_item(key: str) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        item_type = "note" if key == "N1" else "journalArticle"
+        return _api_item(key, item_type=item_type)
+
+    async def _delete_item(key: str) -> None:
+        if key == "D2":
+            raise RuntimeError("boom")
+
+    async def _call_once(func, **_kwargs):
+        return await func()
+
+    item_service.api_client.get_item = AsyncMock(side_effect=_get_item)
+    item_service.delete_item = AsyncMock(side_effect=_delete_item)
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.duplicate_service.async_retry_with_backoff",
+        _call_once,
+    )
+    service = DuplicateDetectionService(item_service=item_service)
+    groups = [
+        DuplicateGroup(primary_key="P1", duplicate_keys=["D1", "N1"]),
+        DuplicateGroup(primary_key="P2", duplicate_keys=["D2"]),
+    ]
+
+    deleted, failed = await service._remove_duplicates(groups, concurrency=2)
+
+    assert peak == 2
+    assert (deleted, failed) == (1, 1)
+    assert item_service.delete_item.await_count == 2
+    item_service.api_client.delete_item.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_find_and_remove_duplicates_counts_only_parent_items_in_scan_total():
     item_service = AsyncMock()
@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -105,7 +106,7 @@ async def test_purge_tags_updates_items_and_reports_summary():
     assert result["total_tags_removed"] == 1
     data_service.update_item.assert_awaited_once()
     updated_item = data_service.update_item.await_args.args[0]
-    assert updated_item["data"]["tags"] == [{"tag": "keep"}]
+    assert updated_item["tags"] == [{"tag": "keep"}]
     assert result["details"][0]["item_key"] == "I1"
     assert result["details"][0]["removed_tags"] == ["AI分析"]
 
@@ -148,3 +149,358 @@ async def test_purge_tags_respects_scan_limit_and_collection_name():
     assert result["items_updated"] == 1
     data_service.get_item.assert_awaited_once()
     data_service.update_item.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_purge_tags_reports_fetch_and_update_failures():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(key="I1", title="Item 1", item_type="journalArticle"),
+            SimpleNamespace(key="I2", title="Item 2", item_type="journalArticle"),
+            SimpleNamespace(key="I3", title="Item 3", item_type="journalArticle"),
+        ]
+    )
+
+    async def _get_item(item_key):
+        if item_key == "I2":
+            raise RuntimeError("fetch failed")
+        return {
+            "key": item_key,
+            "data": {"key": item_key, "version": 1, "tags": [{"tag": "AI分析"}]},
+        }
+
+    async def _update_item(full_item):
+        if full_item["key"] == "I3":
+            raise RuntimeError("update failed")
+        return {}
+
+    data_service.get_item = AsyncMock(side_effect=_get_item)
+    data_service.update_item = AsyncMock(side_effect=_update_item)
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    result = await service.purge_tags(
+        tags=["AI分析"],
+        collection_name=None,
+        batch_size=10,
+        scan_limit=None,
+        update_limit=None,
+        dry_run=False,
+    )
+
+    assert result["total_items_scanned"] == 3
+    assert [detail["item_key"] for detail in result["details"]] == ["I1", "I3"]
+    assert data_service.update_item.await_count == 2
+    assert result["failed"] == 2
+    assert result["failures"] == [
+        {"item_key": "I2", "error": "fetch failed"},
+        {"item_key": "I3", "error": "update failed"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_purge_tags_bulk_fetches_items_missing_from_listing():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(key="I1", title="Item 1", item_type="journalArticle"),
+            SimpleNamespace(key="I2", title="Item 2", item_type="journalArticle"),
+        ]
+    )
+    data_service.get_items_by_keys = AsyncMock(
+        return_value=[
+            {"key": "I1", "version": 3, "data": {"tags": [{"tag": "AI分析"}]}},
+        ]
+    )
+    data_service.get_item = AsyncMock()
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    result = await service.purge_tags(
+        tags=["AI分析"],
+        collection_name=None,
+        batch_size=10,
+        scan_limit=None,
+        update_limit=None,
+        dry_run=True,
+    )
+
+    data_service.get_items_by_keys.assert_awaited_once_with(["I1", "I2"])
+    data_service.get_item.assert_not_awaited()
+    assert result["items_updated"] == 1
+    assert result["failures"] == [
+        {"item_key": "I2", "error": "Item not found: I2"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clean_empty_items_stops_at_treated_limit_in_scan_order():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(key="I1", title="", item_type="journalArticle"),
+            SimpleNamespace(key="I2", title="", item_type="journalArticle"),
+            SimpleNamespace(key="I3", title="Title", item_type="journalArticle"),
+            SimpleNamespace(key="I4", title="", item_type="journalArticle"),
+            SimpleNamespace(key="I5", title="", item_type="journalArticle"),
+        ]
+    )
+
+    async def _children(item_key):
+        if item_key == "I1":
+            return [{"key": "N1"}]
+        if item_key == "I2":
+            raise RuntimeError("lookup failed")
+        return []
+
+    data_service.get_item_children = AsyncMock(side_effect=_children)
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    result = await service.clean_empty_items(
+        collection_name=None,
+        scan_limit=10,
+        treated_limit=1,
+        dry_run=True,
+    )
+
+    assert [c["key"] for c in result["candidates"]] == ["I4"]
+    assert result["total_scanned"] == 4
+
+
+@pytest.mark.asyncio
+async def test_clean_empty_items_scans_collections_concurrently_in_order():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[
+            {"key": "C1", "data": {"name": "First"}},
+            {"key": "C2", "data": {"name": "Second"}},
+            {"key": "C3", "data": {"name": "Third"}},
+        ]
+    )
+    second_started = asyncio.Event()
+    third_cancelled = asyncio.Event()
+
+    async def _collection_items(col_key, limit, start):
+        if start:
+            return []
+        if col_key == "C1":
+            # Only completes if C2 is scanned concurrently.
+            await second_started.wait()
+            return [SimpleNamespace(key="A1", title="", item_type="book")]
+        if col_key == "C2":
+            second_started.set()
+            return [
+                SimpleNamespace(key="B1", title="Title", item_type="book"),
+                SimpleNamespace(key="B2", title="", item_type="book"),
+                SimpleNamespace(key="B3", title="", item_type="book"),
+            ]
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            third_cancelled.set()
+            raise
+        return []
+
+    data_service.get_collection_items = AsyncMock(side_effect=_collection_items)
+    data_service.get_item_children = AsyncMock(return_value=[])
+    records: list[dict] = []
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    result = await service.clean_empty_items(
+        collection_name=None,
+        scan_limit=10,
+        treated_limit=2,
+        dry_run=True,
+        on_record=records.append,
+    )
+
+    assert [r["key"] for r in records] == ["A1", "B2"]
+    assert [r["collection"] for r in records] == ["First", "Second"]
+    assert result["total_scanned"] == 3
+    assert third_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_purge_tags_uses_listing_data_without_refetching():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(
+                key="I1",
+                title="Item 1",
+                item_type="journalArticle",
+                raw_data={
+                    "key": "I1",
+                    "version": 7,
+                    "tags": [{"tag": "AI分析"}, {"tag": "keep"}],
+                },
+            ),
+            SimpleNamespace(key="I2", title="Item 2", item_type="journalArticle"),
+        ]
+    )
+    data_service.get_item = AsyncMock(
+        return_value={"key": "I2", "data": {"tags": [{"tag": "keep"}]}}
+    )
+    data_service.update_item = AsyncMock(return_value={})
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    result = await service.purge_tags(
+        tags=["AI分析"],
+        collection_name=None,
+        batch_size=10,
+        scan_limit=None,
+        update_limit=None,
+        dry_run=False,
+    )
+
+    assert result["items_updated"] == 1
+    data_service.get_item.assert_awaited_once_with("I2")
+    # pyzotero only accepts flat item data or a complete API item wrapper.
+    updated_item = data_service.update_item.await_args.args[0]
+    assert updated_item == {"key": "I1", "version": 7, "tags": [{"tag": "keep"}]}
+
+
+@pytest.mark.asyncio
+async def test_maintenance_writes_use_batch_endpoints():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(key="I1", title="", item_type="journalArticle"),
+            SimpleNamespace(key="I2", title="", item_type="journalArticle"),
+        ]
+    )
+    data_service.get_item_children = AsyncMock(return_value=[])
+    data_service.delete_items = AsyncMock(return_value=None)
+    data_service.delete_item = AsyncMock()
+    data_service.get_item = AsyncMock(
+        side_effect=lambda key: {"key": key, "data": {"tags": [{"tag": "AI分析"}]}}
+    )
+    data_service.update_items = AsyncMock(return_value={"I2": "conflict"})
+    data_service.update_item = AsyncMock()
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    cleaned = await service.clean_empty_items(
+        collection_name=None, scan_limit=10, treated_limit=10, dry_run=False
+    )
+    purged = await service.purge_tags(
+        tags=["AI分析"],
+        collection_name=None,
+        batch_size=10,
+        scan_limit=None,
+        update_limit=None,
+        dry_run=False,
+    )
+
+    data_service.delete_items.assert_awaited_once_with(["I1", "I2"])
+    data_service.delete_item.assert_not_awaited()
+    assert cleaned["deleted"] == 2
+    data_service.update_items.assert_awaited_once()
+    data_service.update_item.assert_not_awaited()
+    assert purged["failures"] == [{"item_key": "I2", "error": "conflict"}]
+
+
+@pytest.mark.asyncio
+async def test_maintenance_streams_records_instead_of_collecting():
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(
+        return_value=[
+            SimpleNamespace(key="I1", title="", item_type="journalArticle"),
+        ]
+    )
+    data_service.get_item_children = AsyncMock(return_value=[])
+    data_service.get_item = AsyncMock(
+        return_value={"key": "I1", "data": {"tags": [{"tag": "AI分析"}]}}
+    )
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    records: list[dict] = []
+    cleaned = await service.clean_empty_items(
+        collection_name=None,
+        scan_limit=10,
+        treated_limit=10,
+        dry_run=True,
+        on_record=records.append,
+    )
+    purged = await service.purge_tags(
+        tags=["AI分析"],
+        collection_name=None,
+        batch_size=10,
+        scan_limit=None,
+        update_limit=None,
+        dry_run=True,
+        on_record=records.append,
+    )
+
+    assert "candidates" not in cleaned
+    assert cleaned["empty_items_found"] == 1
+    assert purged["items_updated"] == 1
+    assert purged["details"] == []
+    assert [record.get("key") or record.get("item_key") for record in records] == [
+        "I1",
+        "I1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_purge_tags_prefetches_next_page_while_processing():
+    events: list[tuple[str, object]] = []
+    listing = [
+        SimpleNamespace(
+            key=f"I{index}",
+            title=f"Item {index}",
+            item_type="journalArticle",
+            raw_data={"key": f"I{index}", "version": 1, "tags": [{"tag": "old"}]},
+        )
+        for index in range(3)
+    ]
+
+    async def _collection_items(col_key, limit, start):
+        events.append(("fetch", start))
+        return listing[start : start + limit]
+
+    async def _update_items(items):
+        await asyncio.sleep(0)
+        events.append(("write", [item["key"] for item in items]))
+        return {}
+
+    data_service = MagicMock()
+    data_service.get_collections = AsyncMock(
+        return_value=[{"key": "C1", "data": {"name": "Inbox"}}]
+    )
+    data_service.get_collection_items = AsyncMock(side_effect=_collection_items)
+    data_service.update_items = AsyncMock(side_effect=_update_items)
+
+    service = LibraryMaintenanceService(data_service=data_service)
+    result = await service.purge_tags(
+        tags=["old"],
+        collection_name=None,
+        batch_size=2,
+        scan_limit=None,
+        update_limit=None,
+        dry_run=False,
+    )
+
+    assert result["items_updated"] == 3
+    assert events == [
+        ("fetch", 0),
+        ("fetch", 2),
+        ("write", ["I0", "I1"]),
+        ("write", ["I2"]),
+    ]
@@ -2,6 +2,7 @@
 
 import argparse
 import json
+import stat
 import subprocess
 import sys
 
@@ -417,3 +418,393 @@ def test_obfuscate_config_masks_api_keys_and_tokens():
     assert obfuscated["CUSTOM_TOKEN"].startswith("toke")
     assert "*" in obfuscated["CUSTOM_TOKEN"]
     assert obfuscated["NORMAL_VALUE"] == "visible"
+
+
+def test_run_coro_reuses_event_loop_across_calls():
+    import asyncio
+
+    from zotero_mcp.cli_app.common import _close_cli_runner, run_coro
+
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    try:
+        first = run_coro(_current_loop())
+        second = run_coro(_current_loop())
+        assert first is second
+    finally:
+        _close_cli_runner()
+
+    assert first.is_closed()
+
+
+def test_lazy_subparsers_only_build_selected_subcommand():
+    from zotero_mcp.cli_app.common import LazyArgumentParser
+
+    parser = build_parser()
+    args = parser.parse_args(["semantic", "db-status"])
+    assert args.subcommand == "db-status"
+
+    semantic_action = next(
+        action
+        for action in parser._subparsers._group_actions  # type: ignore[union-attr]
+        if isinstance(action, argparse._SubParsersAction)
+    )
+    semantic_parser = semantic_action.choices["semantic"]
+    semantic_sub = next(
+        action
+        for action in semantic_parser._actions
+        if isinstance(action, argparse._SubParsersAction)
+    )
+    db_inspect = semantic_sub.choices["db-inspect"]
+    db_status = semantic_sub.choices["db-status"]
+
+    assert isinstance(db_inspect, LazyArgumentParser)
+    assert db_inspect._builder is not None
+    assert db_status._builder is None
+
+
+def test_semantic_db_inspect_merges_exact_and_substring_matches(monkeypatch):
+    from zotero_mcp.cli_app.commands import semantic
+
+    rows = [
+        ("D1", {"title": "Battery cathodes"}),
+        ("D2", {"title": "Zinc battery"}),
+        ("D3", {"title": "Unrelated"}),
+    ]
+
+    class _FakeCollection:
+        def __init__(self):
+            self.where_calls: list[dict] = []
+
+        def count(self):
+            return len(rows)
+
+        def get(self, limit=None, offset=0, include=None, where=None):
+            if where is not None:
+                self.where_calls.append(where)
+                matched = [
+                    (doc_id, meta)
+                    for doc_id, meta in rows
+                    if all(meta.get(k) == v for k, v in where.items())
+                ]
+            else:
+                matched = rows[offset : offset + limit]
+            return {
+                "ids": [doc_id for doc_id, _ in matched],
+                "metadatas": [meta for _, meta in matched],
+            }
+
+    collection = _FakeCollection()
+
+    class _FakeSearch:
+        chroma_client = argparse.Namespace(collection=collection)
+
+    captured: dict = {}
+    monkeypatch.setenv("ZOTERO_LOCAL", "true")
+    monkeypatch.setattr(semantic, "load_config", lambda: None)
+    monkeypatch.setattr(
+        semantic, "emit", lambda _args, payload: captured.update(payload)
+    )
+    import zotero_mcp.services.zotero.semantic_search as semantic_search_module
+
+    monkeypatch.setattr(
+        semantic_search_module,
+        "create_semantic_search",
+        lambda *_args, **_kwargs: _FakeSearch(),
+    )
+
+    args = build_parser().parse_args(
+        ["semantic", "db-inspect", "--filter", "Zinc battery", "--limit", "5"]
+    )
+    assert semantic.run(args) == 0
+    assert collection.where_calls == [{"title": "Zinc battery"}]
+    assert [r["title"] for r in captured["records"]] == ["Zinc battery"]
+
+    captured.clear()
+    args = build_parser().parse_args(
+        ["semantic", "db-inspect", "--filter", "battery", "--limit", "5"]
+    )
+    assert semantic.run(args) == 0
+    assert [r["title"] for r in captured["records"]] == [
+        "Battery cathodes",
+        "Zinc battery",
+    ]
+
+
+def test_semantic_db_inspect_surfaces_chroma_errors(monkeypatch):
+    from zotero_mcp.cli_app.commands import semantic
+
+    class _BrokenCollection:
+        def get(self, **_kwargs):
+            raise RuntimeError("collection is corrupt")
+
+    class _FakeSearch:
+        chroma_client = argparse.Namespace(collection=_BrokenCollection())
+
+    monkeypatch.setenv("ZOTERO_LOCAL", "true")
+    monkeypatch.setattr(semantic, "load_config", lambda: None)
+    import zotero_mcp.services.zotero.semantic_search as semantic_search_module
+
+    monkeypatch.setattr(
+        semantic_search_module,
+        "create_semantic_search",
+        lambda *_args, **_kwargs: _FakeSearch(),
+    )
+
+    args = build_parser().parse_args(["semantic", "db-inspect", "--filter", "x"])
+    with pytest.raises(RuntimeError, match="corrupt"):
+        semantic.run(args)
+
+
+def test_save_zotero_db_path_replaces_config_atomically(tmp_path):
+    from zotero_mcp.cli_app.commands import semantic
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"client_env": {"ZOTERO_LOCAL": "true"}}), encoding="utf-8"
+    )
+
+    semantic._save_zotero_db_path_to_config(config_path, "/tmp/zotero.sqlite")
+
+    assert json.loads(config_path.read_text(encoding="utf-8")) == {
+        "client_env": {"ZOTERO_LOCAL": "true"},
+        "semantic_search": {"zotero_db_path": "/tmp/zotero.sqlite"},
+    }
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_save_zotero_db_path_to_config_preserves_file_mode(tmp_path):
+    from zotero_mcp.cli_app.commands import semantic
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{}", encoding="utf-8")
+    config_path.chmod(0o644)
+
+    semantic._save_zotero_db_path_to_config(config_path, "/tmp/zotero.sqlite")
+
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o644
+
+
+def test_save_zotero_db_path_to_config_clears_parsed_json_cache(tmp_path, monkeypatch):
+    from zotero_mcp.cli_app.commands import semantic
+
+    cleared: list[bool] = []
+    monkeypatch.setattr(semantic, "clear_json_file_cache", lambda: cleared.append(True))
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{}", encoding="utf-8")
+
+    semantic._save_zotero_db_path_to_config(config_path, "/tmp/zotero.sqlite")
+
+    assert cleared == [True]
+
+
+def test_obfuscate_config_masks_exact_and_nested_keys():
+    config = {
+        "zotero_library_id": "1234567",
+        "LIBRARY_ID": "7654321",
+        "TOKEN": "not-a-suffix",
+        "nested": {"client_secret": "abcdefgh", "name": "visible"},
+    }
+
+    obfuscated = obfuscate_config_for_display(config)
+
+    assert obfuscated["zotero_library_id"] == "1234***"
+    assert obfuscated["LIBRARY_ID"] == "7654***"
+    assert obfuscated["TOKEN"] == "not-a-suffix"
+    assert obfuscated["nested"] == {"client_secret": "abcd****", "name": "visible"}
+    assert config["nested"]["client_secret"] == "abcdefgh"
+
+
+def test_semantic_scan_collection_pages_lazily():
+    from zotero_mcp.cli_app.commands import semantic
+
+    class _PagedCollection:
+        def __init__(self):
+            self.offsets: list[int] = []
+
+        def get(self, limit, offset, include):
+            self.offsets.append(offset)
+            ids = [f"D{i}" for i in range(offset, min(offset + limit, 5))]
+            return {"ids": ids, "metadatas": [{"title": i} for i in ids]}
+
+    collection = _PagedCollection()
+    rows = semantic._scan_collection(collection, ["metadatas"], page_size=2)
+    assert next(rows) == ("D0", {"title": "D0"}, None)
+    assert collection.offsets == [0]
+
+    assert [doc_id for doc_id, _, _ in rows] == ["D1", "D2", "D3", "D4"]
+    assert collection.offsets == [0, 2, 4]
+
+
+def test_system_commands_defer_server_setup_and_updater_imports():
+    code = (
+        "import sys\n"
+        "import zotero_mcp.cli_app.commands.system\n"
+        "print([m for m in ('zotero_mcp.server', 'zotero_mcp.utils.system.setup',"
+        " 'zotero_mcp.utils.system.updater') if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "[]"
+
+
+def test_emit_json_matches_stdlib_encoding(capsys):
+    from datetime import datetime
+
+    from zotero_mcp.cli_app.output import emit
+
+    payload = {"title": "Zinc 电池", "added": datetime(2024, 1, 2, 3, 4, 5), 1: [1.5]}
+    emit(argparse.Namespace(output="json"), payload)
+
+    assert capsys.readouterr().out == (
+        json.dumps(payload, indent=2, ensure_ascii=False, default=str) + "\n"
+    )
+
+
+def test_maintenance_commands_accept_jsonl_output(capsys):
+    from zotero_mcp.cli_app.output import emit, emit_stream
+
+    parser = build_parser()
+    args = parser.parse_args(["tags", "purge", "--tags", "AI", "--output", "jsonl"])
+    assert args.output == "jsonl"
+    args = parser.parse_args(["items", "delete-empty", "--output", "jsonl"])
+
+    write = emit_stream(args)
+    assert write is not None
+    write({"key": "I1"})
+    emit(args, {"empty_items_found": 1})
+    assert capsys.readouterr().out == '{"key":"I1"}\n{"empty_items_found":1}\n'
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["items", "list", "--output", "jsonl"])
+    assert emit_stream(argparse.Namespace(output="json")) is None
+
+
+def test_build_parser_registers_only_selected_command():
+    def _commands(parser: argparse.ArgumentParser) -> list[str]:
+        subparsers = next(
+            action
+            for action in parser._actions
+            if isinstance(action, argparse._SubParsersAction)
+        )
+        return list(subparsers.choices)
+
+    argv = ["tags", "list", "--limit", "5"]
+    parser = build_parser(argv)
+
+    assert _commands(parser) == ["tags"]
+    assert parser.parse_args(argv).limit == 5
+    assert len(_commands(build_parser(["--help"]))) == 9
+    assert len(_commands(build_parser())) == 9
+
+
+def test_cli_help_for_one_command_skips_other_command_modules():
+    code = (
+        "import sys\n"
+        "from zotero_mcp.cli_app.registry import build_parser\n"
+        "build_parser(['tags', 'list'])\n"
+        "print(sorted(m.rsplit('.', 1)[-1] for m in sys.modules"
+        " if m.startswith('zotero_mcp.cli_app.commands.')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "['tags']"
+
+
+def test_run_coro_prefers_uvloop_when_installed(monkeypatch):
+    import asyncio
+
+    from zotero_mcp.cli_app import common
+
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def _new_event_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    monkeypatch.setattr(
+        common, "uvloop", argparse.Namespace(new_event_loop=_new_event_loop)
+    )
+    monkeypatch.setattr(common, "_cli_runner", None)
+
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    try:
+        assert common.run_coro(_current_loop()) is created[0]
+    finally:
+        common._close_cli_runner()
+
+
+def test_emit_text_flattens_nested_lists_in_order(capsys):
+    from zotero_mcp.cli_app.output import emit
+
+    deep: list = ["last"]
+    for _ in range(5000):
+        deep = [deep]
+    emit(argparse.Namespace(output="text"), ["a", [None, ["b", {"k": 1}], 2], deep])
+
+    assert capsys.readouterr().out == "a\nb\nk: 1\n2\nlast\n"
+
+
+def test_emit_text_writes_output_once(monkeypatch):
+    import io
+
+    from zotero_mcp.cli_app.output import emit
+
+    class _CountingStdout(io.StringIO):
+        writes = 0
+
+        def write(self, text: str) -> int:
+            self.writes += 1
+            return super().write(text)
+
+    stdout = _CountingStdout()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    emit(argparse.Namespace(output="text"), [{"a": 1, "b": [2]}, "tail"])
+
+    assert stdout.getvalue() == "a: 1\nb:\n[\n  2\n]\ntail\n"
+    assert stdout.writes == 1
+
+
+def test_scan_limit_help_renders_each_parser_default():
+    from zotero_mcp.cli_app.common import add_scan_limit_arg
+
+    parsers = []
+    for default in (100, 500):
+        parser = argparse.ArgumentParser(prog="x")
+        add_scan_limit_arg(parser, default=default)
+        parsers.append(parser)
+
+    assert "(default: 100)" in " ".join(parsers[0].format_help().split())
+    assert "(default: 500)" in " ".join(parsers[1].format_help().split())
+
+
+def test_item_analysis_scanner_import_skips_chromadb():
+    code = (
+        "import sys\n"
+        "import zotero_mcp.services.scanner\n"
+        "print('chromadb' in sys.modules)\n"
+        "from zotero_mcp.clients import ChromaClient\n"
+        "print(ChromaClient.__name__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout.splitlines()[-2:] == ["False", "ChromaClient"]
@@ -8,6 +8,7 @@ from zotero_mcp.utils.config import (
     _clear_cache,
     get_relevant_env_prefixes,
     load_config,
+    load_json_file,
 )
 
 
@@ -109,3 +110,36 @@ def test_priority(mock_home, clear_test_env):
         assert loaded_env.get("ZOTERO_API_KEY") == "env_key"
         # File var should persist if not overridden
         assert loaded_env.get("ZOTERO_LIBRARY_ID") == "file_id"
+
+
+def test_load_json_file_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """Test parsed JSON is cached per file state and copies are isolated."""
+    from pathlib import Path
+
+    from zotero_mcp.utils.config import clear_json_file_cache
+
+    reads: list[Path] = []
+    read_bytes = Path.read_bytes
+
+    def _counting_read_bytes(path: Path) -> bytes:
+        reads.append(path)
+        return read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", _counting_read_bytes)
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"semantic_search": {"model": "a"}}))
+    clear_json_file_cache()
+
+    first = load_json_file(config_file)
+    first["semantic_search"]["model"] = "mutated"
+    second = load_json_file(config_file)
+    assert len(reads) == 1
+    assert second == {"semantic_search": {"model": "a"}}
+
+    config_file.write_text(json.dumps({"semantic_search": {"model": "bb"}}))
+    assert load_json_file(config_file) == {"semantic_search": {"model": "bb"}}
+    assert len(reads) == 2
+
+    clear_json_file_cache()
+    load_json_file(config_file)
+    assert len(reads) == 3
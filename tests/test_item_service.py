@@ -103,6 +103,7 @@ async def test_create_items_skips_intra_batch_duplicates(item_service, mock_api_
     assert result["created"] == 1
     assert result["failed_count"] == 0
     assert result["skipped_duplicates"] == 1
+    assert result["successful"] == {"0": "AAA"}
     mock_api_client.create_items.assert_awaited_once_with(
         [{"itemType": "journalArticle", "title": "Paper A", "DOI": "10.1000/abc"}]
     )
@@ -124,6 +125,28 @@ async def test_create_item_uses_precreate_dedup(item_service, mock_api_client):
     mock_api_client.create_items.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_create_items_reports_input_indices_after_dedup(
+    item_service, mock_api_client
+):
+    mock_api_client.search_items.return_value = []
+    mock_api_client.create_items.return_value = {
+        "successful": {"0": "AAA"},
+        "failed": {"1": {"code": 400, "message": "bad"}},
+    }
+
+    result = await item_service.create_items(
+        [
+            {"itemType": "journalArticle", "title": "Paper A", "DOI": "10.1000/a"},
+            {"itemType": "journalArticle", "title": "Paper A2", "DOI": "10.1000/a"},
+            {"itemType": "journalArticle", "title": "Paper B", "DOI": "10.1000/b"},
+        ]
+    )
+
+    assert result["successful"] == {"0": "AAA"}
+    assert result["failed"] == {"2": {"code": 400, "message": "bad"}}
+
+
 def test_normalize_url_handles_scheme_less_urls():
     assert _normalize_url("example.com/path?a=1#frag") == "https://example.com/path"
     assert _normalize_url("HTTP://Example.com/path/") == "http://example.com/path"
@@ -92,7 +92,7 @@ async def test_search_by_tag_filters_mixed_tag_payload(search_service, mock_api_
     )
 
     mock_api_client.get_items_by_tag.assert_awaited_once_with(
-        "AI分析",
+        ["AI分析", "保留", "-跳过"],
         limit=100,
         start=0,
     )
@@ -145,3 +145,139 @@ async def test_search_by_tag_returns_empty_when_include_tags_invalid(
 
     assert results == []
     mock_api_client.get_items_by_tag.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_items_caches_identical_queries(search_service, mock_api_client):
+    mock_api_client.search_items.return_value = [
+        {"key": "KEY1", "data": {"title": "Test Result"}}
+    ]
+
+    first = await search_service.search_items("query", limit=5)
+    first.clear()
+    second = await search_service.search_items("query", limit=5)
+    await search_service.search_items("query", limit=10)
+
+    assert [item.key for item in second] == ["KEY1"]
+    assert mock_api_client.search_items.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_cache_results_are_copied(search_service, mock_api_client):
+    mock_api_client.search_items.return_value = [
+        {"key": "KEY1", "data": {"title": "Test Result"}}
+    ]
+
+    first = await search_service.search_items("query")
+    first[0].title = "changed"
+    second = await search_service.search_items("query")
+
+    assert second[0].title == "Test Result"
+
+
+@pytest.mark.asyncio
+async def test_search_cache_evicts_least_recently_used(mock_api_client, monkeypatch):
+    from zotero_mcp.services.zotero import search_service as module
+
+    monkeypatch.setattr(module, "SEARCH_CACHE_MAXSIZE", 2)
+    service = SearchService(api_client=mock_api_client)
+    mock_api_client.search_items.return_value = []
+
+    for query in ["a", "b", "a", "c"]:
+        await service.search_items(query)
+    assert mock_api_client.search_items.await_count == 3
+
+    await service.search_items("a")
+    assert mock_api_client.search_items.await_count == 3
+    await service.search_items("b")
+    assert mock_api_client.search_items.await_count == 4
+
+
+def test_response_cache_drops_expired_entries_when_full(monkeypatch):
+    from datetime import datetime, timedelta
+
+    from zotero_mcp.utils.async_helpers import cache as cache_module
+
+    now = datetime(2026, 1, 1)
+    clock = MagicMock()
+    clock.now.side_effect = lambda: now
+    monkeypatch.setattr(cache_module, "datetime", clock)
+    cache = cache_module.ResponseCache(ttl_seconds=60, maxsize=2)
+
+    cache.set("tool", {"q": "old"}, 1)
+    cache.set("tool", {"q": "recent"}, 2)
+    cache.get("tool", {"q": "old"})
+    now += timedelta(seconds=61)
+    cache.set("tool", {"q": "new"}, 3)
+
+    assert len(cache._cache) == 1
+    assert cache.get("tool", {"q": "new"}) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_cache_cleared_by_item_writes(mock_api_client, monkeypatch):
+    from zotero_mcp.services import data_access
+
+    monkeypatch.setattr(data_access, "is_local_mode", lambda: False)
+    data_service = data_access.DataAccessService(api_client=mock_api_client)
+    mock_api_client.get_items_by_tag.return_value = [
+        {"key": "KEY1", "data": {"title": "Tagged", "tags": [{"tag": "t"}]}}
+    ]
+    mock_api_client.update_item.return_value = {}
+
+    await data_service.search_by_tag(["t"])
+    await data_service.search_by_tag(["t"])
+    assert mock_api_client.get_items_by_tag.await_count == 1
+
+    await data_service.item_service.update_item({"key": "KEY1", "data": {}})
+    await data_service.search_by_tag(["t"])
+    assert mock_api_client.get_items_by_tag.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_by_tag_keeps_ambiguous_tags_client_side(
+    search_service, mock_api_client
+):
+    mock_api_client.get_items_by_tag.return_value = [
+        {"key": "K1", "data": {"key": "K1", "tags": [{"tag": "a"}, {"tag": "-b"}]}},
+        {"key": "K2", "data": {"key": "K2", "tags": [{"tag": "a"}, {"tag": "x||y"}]}},
+        {"key": "K3", "data": {"key": "K3", "tags": [{"tag": "a"}]}},
+    ]
+
+    results = await search_service.search_by_tag(
+        tags=["a", "-b"],
+        exclude_tags=["x||y"],
+        limit=10,
+    )
+
+    mock_api_client.get_items_by_tag.assert_awaited_once_with(
+        "a",
+        limit=100,
+        start=0,
+    )
+    assert [item.key for item in results] == ["K1"]
+
+
+@pytest.mark.asyncio
+async def test_search_items_pushes_offset_into_local_search(
+    search_service, mock_local_client
+):
+    mock_local_client.search_items.return_value = []
+
+    await search_service.search_items("query", limit=5, offset=10, qmode="everything")
+
+    mock_local_client.search_items.assert_called_once_with("query", limit=5, offset=10)
+
+
+def test_local_search_items_skips_offset_matches():
+    items = [
+        MagicMock(**{"get_searchable_text.return_value": text})
+        for text in ("match 1", "other", "match 2", "match 3", "match 4")
+    ]
+    local_client = MagicMock(spec=LocalDatabaseClient)
+    local_client.get_items.return_value = items
+
+    results = LocalDatabaseClient.search_items(local_client, "MATCH", limit=2, offset=1)
+
+    assert results == [items[2], items[3]]
+    items[4].get_searchable_text.assert_not_called()
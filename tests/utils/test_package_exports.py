@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+
+# Third-party or heavy stdlib modules that a bare utils import must not load.
+_HEAVY_MODULES = ("bs4", "dotenv", "logging", "lxml", "markdown", "orjson", "yaml")
+
+
+def _loaded_modules(statement: str) -> list[str]:
+    """Run ``statement`` in a fresh interpreter and list every loaded module."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _loaded_utils_modules(statement: str) -> list[str]:
+    return [
+        name
+        for name in _loaded_modules(statement)
+        if name.startswith("zotero_mcp.utils")
+    ]
+
+
+def test_utils_package_loads_subpackages_on_first_access():
+    loaded = _loaded_utils_modules("import zotero_mcp.utils.system.errors")
+
+    assert loaded == [
+        "zotero_mcp.utils",
+        "zotero_mcp.utils._lazy",
+        "zotero_mcp.utils.system",
+        "zotero_mcp.utils.system.errors",
+    ]
+
+
+def test_utils_package_resolves_lazy_exports():
+    from zotero_mcp import utils
+    from zotero_mcp.utils.formatting import DOI_PATTERN
+    from zotero_mcp.utils.system import ZoteroMCPError
+
+    assert utils.DOI_PATTERN is DOI_PATTERN
+    assert utils.ZoteroMCPError is ZoteroMCPError
+    assert set(utils.__all__) <= set(utils._LAZY_EXPORTS)
+
+
+def test_config_package_loads_logging_only_when_requested():
+    loaded = _loaded_utils_modules("from zotero_mcp.utils.config import load_config")
+
+    assert "zotero_mcp.utils.config.config" in loaded
+    assert "zotero_mcp.utils.config.logging" not in loaded
+
+
+def test_light_formatting_helpers_skip_templates_and_config():
+    loaded = _loaded_utils_modules("from zotero_mcp.utils import is_local_mode")
+
+    assert loaded == [
+        "zotero_mcp.utils",
+        "zotero_mcp.utils._lazy",
+        "zotero_mcp.utils.formatting",
+        "zotero_mcp.utils.formatting.helpers",
+    ]
+
+
+def test_utils_package_import_skips_heavy_modules():
+    loaded = set(_loaded_modules("import zotero_mcp.utils"))
+
+    assert loaded.isdisjoint(_HEAVY_MODULES)
+    assert {name for name in loaded if name.startswith("zotero_mcp.utils")} == {
+        "zotero_mcp.utils",
+        "zotero_mcp.utils._lazy",
+    }
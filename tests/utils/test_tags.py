@@ -0,0 +1,32 @@
+from zotero_mcp.utils.formatting.tags import extract_tag_name, normalize_tag_names
+
+
+def test_normalize_tag_names_matches_extract_tag_name():
+    raw_tags = [
+        {"tag": " 保留 ", "type": 1},
+        "  plain  ",
+        {"tag": ""},
+        {"type": 0},
+        "   ",
+        None,
+        42,
+        {"tag": 2024},
+    ]
+
+    expected = [name for raw in raw_tags if (name := extract_tag_name(raw))]
+    assert normalize_tag_names(raw_tags) == expected == ["保留", "plain", "2024"]
+
+
+def test_normalize_tag_names_rejects_non_list_payloads():
+    assert normalize_tag_names(None) == []
+    assert normalize_tag_names("tag") == []
+
+
+def test_extract_tag_name_handles_payload_subclasses():
+    from collections import OrderedDict
+
+    class _Tag(str):
+        pass
+
+    assert extract_tag_name(OrderedDict(tag=" a ")) == "a"
+    assert extract_tag_name(_Tag(" b ")) == "b"
@@ -1,10 +1,12 @@
 """Tests for template utilities."""
 
+from zotero_mcp.utils.data import templates as templates_module
 from zotero_mcp.utils.data.templates import (
     RESEARCH_ANALYSIS_TEMPLATE_JSON,
     RESEARCH_ANALYSIS_TEMPLATE_MD,
     REVIEW_ANALYSIS_TEMPLATE_JSON,
     format_multimodal_section,
+    get_analysis_config,
     get_analysis_template,
     resolve_analysis_template,
 )
@@ -212,3 +214,19 @@ class TestFormatMultimodalSection:
         assert "图片 1" in result or "Image 1" in result
         assert "图片 2" in result or "Image 2" in result
         assert "图片 3" in result or "Image 3" in result
+
+
+class TestAnalysisConfig:
+    """Tests for analysis configuration loading."""
+
+    def test_reuses_parsed_config_until_loaded_config_changes(self, monkeypatch):
+        config = {"env": {"ANALYSIS_QUESTIONS": '["Q1", "Q2"]'}}
+        monkeypatch.setattr(templates_module, "load_config", lambda: config)
+        monkeypatch.setattr(templates_module, "_analysis_config_cache", None)
+
+        first = get_analysis_config()
+        assert first["questions"] == ["Q1", "Q2"]
+        assert get_analysis_config() is first
+
+        config = {"env": {"ANALYSIS_QUESTIONS": "Q3"}}
+        assert get_analysis_config()["questions"] == ["Q3"]